@@ -0,0 +1,169 @@
+# Frame Capture System
+# Records gameplay to disk without stalling the game loop. Each frame's pixels
+# are copied straight from the display surface's buffer into one of a small
+# ring of preallocated buffers; a background thread compresses them with zlib
+# (which releases the GIL) and appends them to chunked recording files. When
+# every buffer is still waiting to be written, the frame is dropped instead.
+#
+# Recording file (.dzc), all little endian:
+#   header   magic "DZCP", version, width, height, pitch, bits per pixel,
+#            RGBA masks and the frame rate
+#   frames   per frame: index, seconds since recording started, compressed
+#            size, then the zlib-compressed raw pixels (pitch * height bytes)
+#
+# python capture.py OUT_DIR CHUNK... exports recordings as a PNG sequence.
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+
+import pygame
+
+CAPTURE_MAGIC = b"DZCP"
+CAPTURE_VERSION = 1
+CAPTURE_HEADER = struct.Struct("<4sHHHHH4IH")
+FRAME_HEADER = struct.Struct("<IdI")
+
+
+class FrameRecorder:
+    """Captures a surface every frame and writes it from a worker thread"""
+
+    def __init__(self, surface, directory="recordings", fps=60, buffer_count=8,
+                 frames_per_chunk=600, compression=1):
+        self.surface = surface
+        self.directory = directory
+        self.fps = fps
+        self.frames_per_chunk = frames_per_chunk
+        self.compression = compression
+        self.width, self.height = surface.get_size()
+        self.pitch = surface.get_pitch()
+        self.buffers = [bytearray(self.pitch * self.height) for _ in range(buffer_count)]
+        self.free = queue.Queue()
+        for slot in range(buffer_count):
+            self.free.put(slot)
+        self.filled = queue.Queue()
+        self.frame_index = 0
+        self.dropped = 0
+        self.started = time.perf_counter()
+
+        now = time.time()
+        millis = int(now * 1000) % 1000
+        self.session = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f".{millis:03d}"
+        self.stopped = False
+        self.chunk_number = 0
+        self.file = None
+        self.chunk_frames = 0
+        self.thread = threading.Thread(target=self.run, name="frame-recorder", daemon=True)
+        self.thread.start()
+
+    def capture(self):
+        """Queue the surface's current pixels, returns False if dropped"""
+        self.frame_index += 1
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        # The buffer proxy locks the surface until it is released
+        pixels = self.surface.get_buffer()
+        with memoryview(pixels) as view:
+            self.buffers[slot][:] = view
+        del pixels
+        self.filled.put((self.frame_index, time.perf_counter() - self.started, slot))
+        return True
+
+    def run(self):
+        while True:
+            item = self.filled.get()
+            if item is None:
+                break
+            index, timestamp, slot = item
+            data = zlib.compress(self.buffers[slot], self.compression)
+            self.free.put(slot)
+            self.write_frame(index, timestamp, data)
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def write_frame(self, index, timestamp, data):
+        if self.file is None or self.chunk_frames >= self.frames_per_chunk:
+            self.rotate()
+        self.file.write(FRAME_HEADER.pack(index, timestamp, len(data)))
+        self.file.write(data)
+        self.chunk_frames += 1
+
+    def rotate(self):
+        """Close the current chunk and start the next one"""
+        if self.file is not None:
+            self.file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        self.chunk_number += 1
+        while True:
+            name = f"capture-{self.session}-{self.chunk_number:03d}.dzc"
+            try:
+                self.file = open(os.path.join(self.directory, name), "xb")
+                break
+            except FileExistsError:
+                # Another recording started in the same millisecond
+                self.session += "x"
+        self.file.write(CAPTURE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, self.width, self.height,
+                                            self.pitch, self.surface.get_bitsize(),
+                                            *self.surface.get_masks(), self.fps))
+        self.chunk_frames = 0
+
+    def stop(self):
+        """Let the worker write out the queued frames and exit, without waiting"""
+        if not self.stopped:
+            self.stopped = True
+            self.filled.put(None)
+
+    def close(self):
+        """Stop the worker and wait until every queued frame is written"""
+        self.stop()
+        self.thread.join()
+
+
+def read_recording(path):
+    """Yield (index, seconds, Surface) for every frame in a recording chunk
+
+    A chunk cut short by a crash ends at its last complete frame.
+    """
+    with open(path, "rb") as file:
+        header = file.read(CAPTURE_HEADER.size)
+        if len(header) < CAPTURE_HEADER.size:
+            return
+        magic, version, width, height, pitch, bitsize, *masks, fps = CAPTURE_HEADER.unpack(header)
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+            raise ValueError(f"{path} is not a version {CAPTURE_VERSION} recording")
+        while True:
+            frame_header = file.read(FRAME_HEADER.size)
+            if len(frame_header) < FRAME_HEADER.size:
+                break
+            index, timestamp, size = FRAME_HEADER.unpack(frame_header)
+            data = file.read(size)
+            if len(data) < size:
+                break
+            surface = pygame.Surface((width, height), 0, bitsize, masks)
+            if surface.get_pitch() != pitch:
+                raise ValueError(f"{path} has a pitch this platform cannot reproduce")
+            surface.get_buffer().write(zlib.decompress(data))
+            yield index, timestamp, surface
+
+
+def export_png(paths, directory):
+    """Save every frame of the given chunks, in order, as one numbered PNG sequence"""
+    os.makedirs(directory, exist_ok=True)
+    # Every recording numbers its frames from 1, so number the output separately
+    number = 0
+    for path in paths:
+        for _, _, surface in read_recording(path):
+            number += 1
+            pygame.image.save(surface, os.path.join(directory, f"frame{number:06d}.png"))
+    return number
+
+
+if __name__ == "__main__":
+    export_png(sys.argv[2:], sys.argv[1])
@@ -0,0 +1,486 @@
+# Training Environment
+# Headless, Gym-style version of the game rules for training bots: player
+# movement against the tile map, zombie and ghost chase, gold and power-up
+# pickup, scoring and level progression. Every world's state lives in NumPy
+# arrays with the world index as the first axis, so VecEnv steps all worlds
+# at once and observations are views of those arrays rather than copies.
+#
+# Observations are valid until the next step() or reset(); copy them if they
+# need to be kept. Level files in level_dir replace the generated layouts and
+# spawns, as they do in the game. Shooting is not modelled, so the damage and shotgun
+# power-ups only add to the score.
+import ctypes
+import multiprocessing
+import os
+
+import numpy as np
+
+from levels import (POWERUP_TYPES, SPAWN_GHOST, SPAWN_GOLD, SPAWN_PLAYER, SPAWN_POWERUP, SPAWN_ZOMBIE,
+                    LevelFile, generate_level_layout, level_path, validate_level)
+
+try:
+    import gymnasium
+except ImportError:
+    gymnasium = None
+
+# Rule constants, kept in step with main.py (speeds and timers per frame)
+WIDTH, HEIGHT = 1200, 800
+TILE_SIZE = 40
+GRID_WIDTH, GRID_HEIGHT = WIDTH // TILE_SIZE, HEIGHT // TILE_SIZE
+PLAYER_SPEED = 5
+PLAYER_HALF = 20  # Player, zombie and ghost sprites are 40x40
+MAX_HEALTH = 100
+INVULNERABLE_FRAMES = 60
+ATTACK_RANGE = 50
+ZOMBIE, GHOST = 0, 1
+ENEMY_SPEED = np.array([2, 3], dtype=np.float32)
+ENEMY_DAMAGE = np.array([15, 10], dtype=np.float32)
+GOLD_REACH = 30  # Half of player plus half of a 20x20 coin
+POWERUP_REACH = 32.5  # Half of player plus half of a 25x25 power-up
+HEALTH, SPEED, SHIELD = 0, 1, 4
+SPEED_FRAMES = 600
+SHIELD_FRAMES = 1200
+MAX_ENEMIES = 16
+MAX_GOLD = 16
+
+# Actions: no-op and the eight arrow-key directions
+ACTIONS = np.array([(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1),
+                    (-1, -1), (1, -1), (-1, 1), (1, 1)], dtype=np.float32)
+
+
+def state_layout(num_envs):
+    """Name, shape and dtype of every state array for num_envs worlds"""
+    return [
+        ("tiles", (num_envs, GRID_HEIGHT, GRID_WIDTH), np.uint8),
+        ("player_pos", (num_envs, 2), np.float32),
+        ("player_health", (num_envs,), np.float32),
+        ("invulnerable", (num_envs,), np.int32),
+        ("speed_boost", (num_envs,), np.float32),
+        ("speed_timer", (num_envs,), np.int32),
+        ("shield_timer", (num_envs,), np.int32),
+        ("enemy_pos", (num_envs, MAX_ENEMIES, 2), np.float32),
+        ("enemy_kind", (num_envs, MAX_ENEMIES), np.int8),
+        ("enemy_alive", (num_envs, MAX_ENEMIES), np.bool_),
+        ("gold_pos", (num_envs, MAX_GOLD, 2), np.float32),
+        ("gold_alive", (num_envs, MAX_GOLD), np.bool_),
+        ("powerup_pos", (num_envs, 2), np.float32),
+        ("powerup_kind", (num_envs,), np.int8),
+        ("powerup_alive", (num_envs,), np.bool_),
+        ("level", (num_envs,), np.int32),
+        ("coins", (num_envs,), np.int32),
+        ("required_coins", (num_envs,), np.int32),
+        ("score", (num_envs,), np.int32),
+        ("steps", (num_envs,), np.int32),
+    ]
+
+
+def arrays_from_buffer(buffer, num_envs):
+    """Lay the state arrays for num_envs worlds out over one flat buffer"""
+    arrays = {}
+    offset = 0
+    for name, shape, dtype in state_layout(num_envs):
+        dtype = np.dtype(dtype)
+        offset = -(-offset // 8) * 8
+        count = int(np.prod(shape))
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+        offset += count * dtype.itemsize
+    return arrays
+
+
+def buffer_size(num_envs):
+    size = 0
+    for _, shape, dtype in state_layout(num_envs):
+        size = -(-size // 8) * 8 + int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return size
+
+
+class VecEnv:
+    """Steps num_envs independent worlds in lockstep
+
+    step() takes one action per world and returns (observations, rewards,
+    terminated, truncated, infos). With autoreset on, worlds that finish are
+    reset in the same step, like gymnasium's same-step autoreset mode:
+    infos["final_obs"] holds their last observation before the reset, and
+    infos["_final_obs"] marks which worlds it is valid for.
+    """
+
+    def __init__(self, num_envs, seed=None, max_steps=10000, autoreset=True, arrays=None,
+                 final_arrays=None, level_dir="maps"):
+        self.num_envs = num_envs
+        self.level_dir = level_dir
+        self.max_steps = max_steps
+        self.autoreset = autoreset
+        self.rng = np.random.default_rng(seed)
+        if arrays is None:
+            arrays = {name: np.zeros(shape, dtype=dtype)
+                      for name, shape, dtype in state_layout(num_envs)}
+        self.arrays = arrays
+        for name, array in arrays.items():
+            setattr(self, name, array)
+        # Last observation of worlds reset by autoreset, only the rows of worlds
+        # that finished this step are written
+        if final_arrays is None:
+            final_arrays = {name: np.zeros_like(array) for name, array in arrays.items()}
+        self.final_arrays = final_arrays
+        self.index = np.arange(num_envs)
+        self.layouts = {}
+
+    def observations(self):
+        """Views of the tile map and entity arrays, shared with the env"""
+        return self.arrays
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.reset_worlds(self.index)
+        return self.observations(), {}
+
+    def reset_worlds(self, worlds):
+        """Restart the given worlds from level 1"""
+        self.score[worlds] = 0
+        self.steps[worlds] = 0
+        self.player_health[worlds] = MAX_HEALTH
+        self.invulnerable[worlds] = 0
+        self.speed_boost[worlds] = 0
+        self.speed_timer[worlds] = 0
+        self.shield_timer[worlds] = 0
+        for world in worlds:
+            self.load_level(world, 1, 3)
+
+    def layout(self, level_num, required_coins):
+        """Tile map and spawn records for a level, loaded once and reused"""
+        layout = self.layouts.get(level_num)
+        if layout is None:
+            path = level_path(self.level_dir, level_num)
+            if os.path.exists(path):
+                level_file = LevelFile(path)
+                try:
+                    validate_level(level_file, GRID_WIDTH, GRID_HEIGHT, TILE_SIZE, required_coins)
+                    tiles = np.frombuffer(level_file.tiles.data, dtype=np.uint8)
+                    tiles = tiles.reshape(GRID_HEIGHT, GRID_WIDTH).copy()
+                    spawns = list(level_file.spawns())
+                finally:
+                    level_file.close()
+            else:
+                tile_map = generate_level_layout(level_num)
+                tiles = np.frombuffer(tile_map.data, dtype=np.uint8).reshape(tile_map.height, tile_map.width)
+                spawns = []
+            layout = self.layouts[level_num] = (tiles, spawns)
+        return layout
+
+    def clear_points(self, tiles, count):
+        """count random points that are not inside a wall tile"""
+        points = self.rng.integers(100, [WIDTH - 100, HEIGHT - 100], endpoint=True, size=(count * 100, 2))
+        free = tiles[points[:, 1] // TILE_SIZE, points[:, 0] // TILE_SIZE] == 0
+        return points[free][:count]
+
+    def player_spawn(self, tiles):
+        """Random point where the whole player rect is clear of walls"""
+        candidates = self.rng.integers(100, [WIDTH - 100, HEIGHT - 100], endpoint=True,
+                                       size=(1000, 2)).astype(np.float32)
+        blocked = hits_walls(tiles[None], candidates[:, 0][None], candidates[:, 1][None], 0)[0]
+        clear = candidates[~blocked]
+        return clear[0] if len(clear) else (100, 100)
+
+    def load_level(self, world, level_num, required_coins):
+        """Generate a level in one world, like spawn_new_level in main.py"""
+        tiles = self.tiles[world]
+        tiles[:], spawns = self.layout(level_num, required_coins)
+        self.level[world] = level_num
+        self.coins[world] = 0
+        self.required_coins[world] = required_coins
+        if spawns:
+            self.place_spawns(world, spawns)
+            return
+
+        # Player needs a whole clear 40x40 rect, enemies and pickups a clear point
+        self.player_pos[world] = self.player_spawn(tiles)
+
+        enemies = self.clear_points(tiles, min(2 + level_num, MAX_ENEMIES))
+        self.enemy_alive[world] = False
+        self.enemy_alive[world, :len(enemies)] = True
+        self.enemy_pos[world, :len(enemies)] = enemies
+        self.enemy_kind[world] = np.arange(MAX_ENEMIES) % 2
+
+        gold = self.clear_points(tiles, min(required_coins, MAX_GOLD))
+        self.gold_alive[world] = False
+        self.gold_alive[world, :len(gold)] = True
+        self.gold_pos[world, :len(gold)] = gold
+
+        self.powerup_alive[world] = False
+        if self.rng.random() < 0.5:  # 50% chance
+            position = self.clear_points(tiles, 1)
+            if len(position):
+                self.powerup_alive[world] = True
+                self.powerup_pos[world] = position[0]
+                self.powerup_kind[world] = self.rng.integers(len(POWERUP_TYPES))
+
+    def place_spawns(self, world, spawns):
+        """Place entities at a level file's spawn points, like spawn_from_file in main.py"""
+        self.enemy_alive[world] = False
+        self.gold_alive[world] = False
+        self.powerup_alive[world] = False
+        player = None
+        enemies = 0
+        gold = 0
+        for kind, variant, x, y in spawns:
+            if kind == SPAWN_PLAYER:
+                player = (x, y)
+            elif kind in (SPAWN_ZOMBIE, SPAWN_GHOST) and enemies < MAX_ENEMIES:
+                self.enemy_pos[world, enemies] = (x, y)
+                self.enemy_kind[world, enemies] = ZOMBIE if kind == SPAWN_ZOMBIE else GHOST
+                self.enemy_alive[world, enemies] = True
+                enemies += 1
+            elif kind == SPAWN_GOLD and gold < MAX_GOLD:
+                self.gold_pos[world, gold] = (x, y)
+                self.gold_alive[world, gold] = True
+                gold += 1
+            elif kind == SPAWN_POWERUP:
+                self.powerup_pos[world] = (x, y)
+                self.powerup_kind[world] = variant
+                self.powerup_alive[world] = True
+        self.player_pos[world] = player if player is not None else self.player_spawn(self.tiles[world])
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        score_before = self.score.copy()
+        self.steps += 1
+
+        # Player movement, each axis reverted separately like Player.update
+        speed = PLAYER_SPEED + self.speed_boost
+        direction = ACTIONS[actions]
+        x, y = self.player_pos[:, 0], self.player_pos[:, 1]
+        new_x = x + direction[:, 0] * speed
+        blocked = (hits_walls(self.tiles, new_x[:, None], y[:, None], 0)[:, 0] |
+                   (new_x - PLAYER_HALF < 0) | (new_x + PLAYER_HALF > WIDTH))
+        x[:] = np.where(blocked, x, new_x)
+        new_y = y + direction[:, 1] * speed
+        blocked = (hits_walls(self.tiles, x[:, None], new_y[:, None], 0)[:, 0] |
+                   (new_y - PLAYER_HALF < 0) | (new_y + PLAYER_HALF > HEIGHT))
+        y[:] = np.where(blocked, y, new_y)
+
+        # Enemies chase the player, ghosts phase through small walls
+        offset = self.player_pos[:, None, :] - self.enemy_pos
+        distance = np.sqrt((offset ** 2).sum(axis=2))
+        stride = ENEMY_SPEED[self.enemy_kind] / np.maximum(distance, 1e-6)
+        moved = self.enemy_pos + offset * stride[:, :, None]
+        moved = np.where((distance > 0)[:, :, None], moved, self.enemy_pos)
+        phase = np.where(self.enemy_kind == GHOST, 1, 0)
+        blocked = hits_walls(self.tiles, moved[:, :, 0], moved[:, :, 1], phase)
+        self.enemy_pos[:] = np.where(blocked[:, :, None], self.enemy_pos, moved)
+
+        # Enemy attacks, the hardest hitter in reach lands while vulnerable
+        offset = self.player_pos[:, None, :] - self.enemy_pos
+        touching = (np.abs(offset) < 2 * PLAYER_HALF).all(axis=2)
+        in_range = (offset ** 2).sum(axis=2) < ATTACK_RANGE ** 2
+        attacking = touching & in_range & self.enemy_alive
+        damage = np.where(attacking, ENEMY_DAMAGE[self.enemy_kind], 0).max(axis=1)
+        hurt = (damage > 0) & (self.invulnerable == 0) & (self.shield_timer == 0)
+        self.player_health -= np.where(hurt, damage, 0)
+        terminated = self.player_health <= 0
+        self.invulnerable[:] = np.where(hurt & ~terminated, INVULNERABLE_FRAMES,
+                                        np.maximum(self.invulnerable - 1, 0))
+
+        # Gold pickup
+        reach = np.abs(self.gold_pos - self.player_pos[:, None, :]) < GOLD_REACH
+        collected = reach.all(axis=2) & self.gold_alive
+        self.gold_alive &= ~collected
+        count = collected.sum(axis=1, dtype=np.int32)
+        self.coins += count
+        self.score += 10 * count
+
+        # Power-up pickup and effect timers
+        reach = np.abs(self.powerup_pos - self.player_pos) < POWERUP_REACH
+        picked = reach.all(axis=1) & self.powerup_alive
+        self.powerup_alive &= ~picked
+        self.score += 50 * picked
+        kind = self.powerup_kind
+        heal = picked & (kind == HEALTH)
+        self.player_health[heal] = np.minimum(MAX_HEALTH, self.player_health[heal] + 25)
+        self.speed_timer[:] = np.maximum(self.speed_timer - 1, 0)
+        self.shield_timer[:] = np.maximum(self.shield_timer - 1, 0)
+        self.speed_timer[picked & (kind == SPEED)] = SPEED_FRAMES
+        self.shield_timer[picked & (kind == SHIELD)] = SHIELD_FRAMES
+        self.speed_boost[:] = np.where(self.speed_timer > 0, 2, 0)
+
+        rewards = (self.score - score_before).astype(np.float32)
+        truncated = (self.steps >= self.max_steps) & ~terminated
+        level_complete = (self.coins >= self.required_coins) & ~terminated
+
+        # Level progression, as when ESC is pressed on the completion screen
+        for world in np.flatnonzero(level_complete):
+            level_num = int(self.level[world]) + 1
+            self.player_health[world] = MAX_HEALTH
+            self.load_level(world, level_num, 3 + level_num)
+
+        infos = {"level_complete": level_complete}
+        if self.autoreset:
+            finished = terminated | truncated
+            done = np.flatnonzero(finished)
+            if len(done):
+                for name, array in self.arrays.items():
+                    self.final_arrays[name][done] = array[done]
+                self.reset_worlds(done)
+            infos["final_obs"] = self.final_arrays
+            infos["_final_obs"] = finished
+        return self.observations(), rewards, terminated, truncated, infos
+
+    def close(self):
+        pass
+
+
+def hits_walls(tiles, x, y, phase):
+    """Whether 40x40 rects centred on (x, y) overlap a blocking tile
+
+    tiles has one map per world and x, y have shape (worlds, k). Any non-zero
+    tile blocks, except that where phase is 1 only main walls (1) block.
+    """
+    worlds = np.arange(len(tiles))[:, None]
+    left = np.floor((x - PLAYER_HALF) / TILE_SIZE).astype(np.intp)
+    right = np.floor((x + PLAYER_HALF - 1) / TILE_SIZE).astype(np.intp)
+    top = np.floor((y - PLAYER_HALF) / TILE_SIZE).astype(np.intp)
+    bottom = np.floor((y + PLAYER_HALF - 1) / TILE_SIZE).astype(np.intp)
+    np.clip(left, 0, GRID_WIDTH - 1, out=left)
+    np.clip(right, 0, GRID_WIDTH - 1, out=right)
+    np.clip(top, 0, GRID_HEIGHT - 1, out=top)
+    np.clip(bottom, 0, GRID_HEIGHT - 1, out=bottom)
+    corners = (tiles[worlds, top, left] | tiles[worlds, top, right] |
+               tiles[worlds, bottom, left] | tiles[worlds, bottom, right])
+    blocked = corners != 0
+    if np.any(phase):
+        main_wall = ((tiles[worlds, top, left] == 1) | (tiles[worlds, top, right] == 1) |
+                     (tiles[worlds, bottom, left] == 1) | (tiles[worlds, bottom, right] == 1))
+        blocked = np.where(phase == 1, main_wall, blocked)
+    return blocked
+
+
+def _space(shape, dtype):
+    """gymnasium space matching one observation array"""
+    if dtype.kind == "f":
+        return gymnasium.spaces.Box(-np.inf, np.inf, shape, dtype)
+    if dtype.kind == "b":
+        return gymnasium.spaces.Box(0, 1, shape, dtype)
+    info = np.iinfo(dtype)
+    return gymnasium.spaces.Box(info.min, info.max, shape, dtype)
+
+
+class Env(gymnasium.Env if gymnasium is not None else object):
+    """Single-world environment, a gymnasium.Env when gymnasium is installed
+
+    Observations are views like VecEnv's. Pass copy=True for a fresh copy on
+    every call, which gymnasium's check_env requires.
+    """
+    metadata = {"render_modes": []}
+    render_mode = None
+
+    def __init__(self, seed=None, max_steps=10000, copy=False, level_dir="maps"):
+        self.vec = VecEnv(1, seed=seed, max_steps=max_steps, autoreset=False, level_dir=level_dir)
+        self.copy = copy
+        if gymnasium is not None:
+            spaces = gymnasium.spaces
+            self.action_space = spaces.Discrete(len(ACTIONS))
+            self.observation_space = spaces.Dict({
+                name: _space(shape[1:], np.dtype(dtype)) for name, shape, dtype in state_layout(1)
+            })
+
+    def observation(self):
+        # [0, ...] keeps scalar fields as 0-d views instead of copies
+        if self.copy:
+            return {name: array[0, ...].copy() for name, array in self.vec.arrays.items()}
+        return {name: array[0, ...] for name, array in self.vec.arrays.items()}
+
+    def reset(self, seed=None, options=None):
+        if gymnasium is not None:
+            super().reset(seed=seed)
+        self.vec.reset(seed)
+        return self.observation(), {}
+
+    def step(self, action):
+        _, rewards, terminated, truncated, infos = self.vec.step([action])
+        info = {"level_complete": bool(infos["level_complete"][0])}
+        return self.observation(), float(rewards[0]), bool(terminated[0]), bool(truncated[0]), info
+
+    def close(self):
+        pass
+
+
+def _shard_worker(connection, buffer, final_buffer, num_envs, start, end, seed, max_steps, level_dir):
+    """Run worlds start..end of a SubprocVecEnv in a child process"""
+    arrays = {name: array[start:end] for name, array in arrays_from_buffer(buffer, num_envs).items()}
+    final_arrays = {name: array[start:end] for name, array in arrays_from_buffer(final_buffer, num_envs).items()}
+    env = VecEnv(end - start, seed=seed, max_steps=max_steps, arrays=arrays, final_arrays=final_arrays,
+                 level_dir=level_dir)
+    while True:
+        command, data = connection.recv()
+        if command == "step":
+            _, rewards, terminated, truncated, infos = env.step(data)
+            connection.send((rewards, terminated, truncated, infos["level_complete"], infos["_final_obs"]))
+        elif command == "reset":
+            env.reset(data)
+            connection.send(None)
+        elif command == "close":
+            connection.close()
+            break
+
+
+class SubprocVecEnv:
+    """VecEnv split into shards that step in parallel worker processes
+
+    All worlds share one block of shared memory, so observations are views
+    of the same arrays the workers write into. Final observations of worlds
+    that autoreset live in a second shared block.
+    """
+
+    def __init__(self, num_envs, num_workers=None, seed=None, max_steps=10000, level_dir="maps"):
+        context = multiprocessing.get_context()
+        num_workers = min(num_workers or multiprocessing.cpu_count(), num_envs)
+        self.num_envs = num_envs
+        self.buffer = context.RawArray(ctypes.c_uint8, buffer_size(num_envs))
+        self.arrays = arrays_from_buffer(self.buffer, num_envs)
+        self.final_buffer = context.RawArray(ctypes.c_uint8, buffer_size(num_envs))
+        self.final_arrays = arrays_from_buffer(self.final_buffer, num_envs)
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        seeds = np.random.SeedSequence(seed).spawn(num_workers)
+        self.shards = []
+        self.connections = []
+        self.processes = []
+        for worker in range(num_workers):
+            start, end = int(bounds[worker]), int(bounds[worker + 1])
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_shard_worker,
+                args=(child, self.buffer, self.final_buffer, num_envs, start, end, seeds[worker], max_steps,
+                      level_dir),
+                daemon=True)
+            process.start()
+            child.close()
+            self.shards.append((start, end))
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def observations(self):
+        return self.arrays
+
+    def reset(self, seed=None):
+        seeds = [None] * len(self.shards) if seed is None else np.random.SeedSequence(seed).spawn(len(self.shards))
+        for connection, shard_seed in zip(self.connections, seeds):
+            connection.send(("reset", shard_seed))
+        for connection in self.connections:
+            connection.recv()
+        return self.observations(), {}
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        for connection, (start, end) in zip(self.connections, self.shards):
+            connection.send(("step", actions[start:end]))
+        results = [connection.recv() for connection in self.connections]
+        rewards, terminated, truncated, level_complete, finished = (np.concatenate(part) for part in zip(*results))
+        infos = {"level_complete": level_complete, "final_obs": self.final_arrays, "_final_obs": finished}
+        return self.observations(), rewards, terminated, truncated, infos
+
+    def close(self):
+        for connection in self.connections:
+            connection.send(("close", None))
+            connection.close()
+        for process in self.processes:
+            process.join()
@@ -0,0 +1,82 @@
+# Quality Governor
+# Watches how long each frame's work takes (excluding the time clock.tick
+# sleeps) and moves between quality tiers to keep the frame rate steady.
+# Dropping a tier happens as soon as a full window of frames runs over budget;
+# climbing back needs a long stretch of spare time, so the game does not
+# bounce between tiers.
+from collections import deque
+
+
+class QualityTier:
+    """One set of quality settings the governor can switch to"""
+
+    def __init__(self, name, animation_interval, ai_interval, particle_cap, hud_interval, dirty_rects):
+        self.name = name
+        self.animation_interval = animation_interval  # Frames between Gold/PowerUp animation steps
+        self.ai_interval = ai_interval  # Frames between enemy movement updates
+        self.particle_cap = particle_cap
+        self.hud_interval = hud_interval  # Frames between HUD redraws
+        self.dirty_rects = dirty_rects  # Update only changed screen areas instead of flipping
+
+
+class QualityGovernor:
+    """Picks a quality tier from a rolling window of frame work times"""
+
+    def __init__(self, tiers, frame_budget_ms, window=90, degrade_at=0.9, upgrade_at=0.6, hold_frames=300):
+        self.tiers = tiers
+        self.frame_budget_ms = frame_budget_ms
+        self.samples = deque(maxlen=window)
+        self.degrade_at = degrade_at
+        self.upgrade_at = upgrade_at
+        self.hold_frames = hold_frames
+        self.tier_index = 0
+        self.frame = 0
+        self.frames_since_change = 0
+
+    @property
+    def tier(self):
+        return self.tiers[self.tier_index]
+
+    def due(self, interval):
+        """Whether work that runs every interval frames runs this frame"""
+        return self.frame % interval == 0
+
+    def frame_time(self):
+        """90th percentile work time over the window, in ms"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[int(len(ordered) * 0.9)]
+
+    def headroom(self):
+        """Spare ms per frame at the current tier, negative when over budget"""
+        return self.frame_budget_ms - self.frame_time()
+
+    def metrics(self):
+        return {
+            "tier": self.tier.name,
+            "tier_index": self.tier_index,
+            "frame_ms": self.frame_time(),
+            "headroom_ms": self.headroom(),
+        }
+
+    def record(self, work_ms):
+        """Add one frame's work time, returns True if the tier changed"""
+        self.frame += 1
+        self.frames_since_change += 1
+        self.samples.append(work_ms)
+        if len(self.samples) < self.samples.maxlen:
+            return False
+        load = self.frame_time() / self.frame_budget_ms
+        if load > self.degrade_at and self.tier_index < len(self.tiers) - 1:
+            return self.change(1)
+        if (load < self.upgrade_at and self.tier_index > 0 and
+                self.frames_since_change >= self.hold_frames):
+            return self.change(-1)
+        return False
+
+    def change(self, step):
+        self.tier_index += step
+        self.samples.clear()
+        self.frames_since_change = 0
+        return True
@@ -0,0 +1,347 @@
+# Level Data
+# Tile maps are stored one byte per tile in a flat buffer, and levels can be
+# saved to and memory-mapped from a small binary file format:
+#
+#   header   magic "DZLV", version, width, height, spawn count and the byte
+#            offsets of the tile and spawn layers (little endian)
+#   tiles    width * height bytes, row by row (0 floor, 1 wall, 2 small wall)
+#   spawns   one record per spawn point: kind, variant, x, y in pixels
+#
+# Loading maps the file instead of parsing it, so the tile layer is read
+# straight from the page cache and only the parts that are used get touched.
+# The game itself has no camera and only plays maps of exactly one screen
+# (30x20 tiles); larger maps are for tools that read them through TileMap.
+# validate_level checks a file against those limits before it is played.
+import mmap
+import os
+import struct
+import sys
+
+LEVEL_MAGIC = b"DZLV"
+LEVEL_VERSION = 1
+LEVEL_HEADER = struct.Struct("<4sHHHIII")
+SPAWN_RECORD = struct.Struct("<BBHH")
+
+# Spawn kinds, the variant byte holds the power-up type for POWERUP
+SPAWN_PLAYER = 0
+SPAWN_ZOMBIE = 1
+SPAWN_GHOST = 2
+SPAWN_GOLD = 3
+SPAWN_POWERUP = 4
+POWERUP_TYPES = ["health", "speed", "damage", "shotgun", "shield"]
+
+# Fixed entities of the first level at launch, when there is no level file
+OPENING_SPAWNS = [
+    (SPAWN_ZOMBIE, 0, 800, 300),
+    (SPAWN_ZOMBIE, 0, 1000, 500),
+    (SPAWN_GHOST, 0, 400, 200),
+    (SPAWN_GOLD, 0, 500, 300),
+    (SPAWN_GOLD, 0, 700, 400),
+    (SPAWN_GOLD, 0, 900, 200),
+    (SPAWN_POWERUP, POWERUP_TYPES.index("speed"), 600, 600),
+]
+
+
+class TileMap:
+    """Grid of tile ids, one byte per tile, indexed as tile_map[row, col]"""
+
+    def __init__(self, width, height, data=None):
+        self.width = width
+        self.height = height
+        # Any byte buffer works: a bytearray, or a memoryview of a mapped file
+        self.data = bytearray(width * height) if data is None else data
+
+    @classmethod
+    def from_rows(cls, rows):
+        tile_map = cls(len(rows[0]), len(rows))
+        for row_index, row in enumerate(rows):
+            start = row_index * tile_map.width
+            tile_map.data[start:start + tile_map.width] = bytes(row)
+        return tile_map
+
+    def __getitem__(self, position):
+        row, col = position
+        return self.data[row * self.width + col]
+
+    def __setitem__(self, position, tile):
+        row, col = position
+        self.data[row * self.width + col] = tile
+
+    def row(self, row):
+        start = row * self.width
+        return memoryview(self.data)[start:start + self.width]
+
+    def __iter__(self):
+        """Rows as byte views, so maps can be walked like lists of lists"""
+        for row in range(self.height):
+            yield self.row(row)
+
+    def __len__(self):
+        return self.height
+
+
+class LevelFile:
+    """Memory-mapped level file, close() when the level is no longer used"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.mapping)
+        if len(view) < LEVEL_HEADER.size:
+            raise ValueError(f"{path} is not a level file")
+        magic, version, width, height, spawn_count, tile_offset, spawn_offset = LEVEL_HEADER.unpack_from(view)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError(f"{path} is not a version {LEVEL_VERSION} level file")
+        if (tile_offset + width * height > len(view) or
+                spawn_offset + spawn_count * SPAWN_RECORD.size > len(view)):
+            raise ValueError(f"{path} is truncated")
+        self.tiles = TileMap(width, height, view[tile_offset:tile_offset + width * height])
+        self.spawn_view = view[spawn_offset:spawn_offset + spawn_count * SPAWN_RECORD.size]
+        self.spawn_count = spawn_count
+
+    def spawns(self):
+        """Yield (kind, variant, x, y) for every spawn point"""
+        return SPAWN_RECORD.iter_unpack(self.spawn_view)
+
+    def close(self):
+        self.tiles.data.release()
+        self.spawn_view.release()
+        self.mapping.close()
+
+
+def validate_level(level_file, columns, rows, tile_size, required_coins):
+    """Raise ValueError unless a level file fits the screen and can be finished"""
+    tiles = level_file.tiles
+    if (tiles.width, tiles.height) != (columns, rows):
+        raise ValueError(f"{level_file.path} is {tiles.width}x{tiles.height} tiles, the game needs "
+                         f"{columns}x{rows}")
+    if not level_file.spawn_count:
+        return
+    gold = 0
+    for kind, variant, x, y in level_file.spawns():
+        if kind > SPAWN_POWERUP:
+            raise ValueError(f"{level_file.path} has a spawn of unknown kind {kind}")
+        if kind == SPAWN_POWERUP and variant >= len(POWERUP_TYPES):
+            raise ValueError(f"{level_file.path} has a power-up of unknown type {variant}")
+        if x >= columns * tile_size or y >= rows * tile_size:
+            raise ValueError(f"{level_file.path} has a spawn at ({x}, {y}), off the screen")
+        gold += kind == SPAWN_GOLD
+    if gold < required_coins:
+        raise ValueError(f"{level_file.path} has {gold} gold spawns, the level needs {required_coins}")
+
+
+def save_level(path, tile_map, spawns=()):
+    """Write a tile map and (kind, variant, x, y) spawn points to path"""
+    spawns = list(spawns)
+    tile_offset = LEVEL_HEADER.size
+    spawn_offset = tile_offset + tile_map.width * tile_map.height
+    with open(path, "wb") as file:
+        file.write(LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, tile_map.width, tile_map.height,
+                                     len(spawns), tile_offset, spawn_offset))
+        file.write(tile_map.data)
+        for spawn in spawns:
+            file.write(SPAWN_RECORD.pack(*spawn))
+
+
+def export_levels(directory, level_nums):
+    """Save the generated layouts as level files
+
+    Level 1 keeps the fixed opening spawns, the others are left random.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for level_num in level_nums:
+        spawns = OPENING_SPAWNS if level_num == 1 else ()
+        save_level(level_path(directory, level_num), generate_level_layout(level_num), spawns)
+
+
+def level_path(directory, level_num):
+    return os.path.join(directory, f"level{level_num:03d}.dzl")
+
+
+# Level Generation System
+def generate_level_layout(level_num):
+    """Generate different layouts for each level with increasing difficulty"""
+    width, height = 30, 20  # Grid size
+    map_data = [[0 for _ in range(width)] for _ in range(height)]
+    
+    # Add borders
+    for i in range(width):
+        map_data[0][i] = 1
+        map_data[height-1][i] = 1
+    for i in range(height):
+        map_data[i][0] = 1
+        map_data[i][width-1] = 1
+    
+    if level_num == 1:
+        # Level 1: Simple layout with few obstacles
+        generate_simple_layout(map_data, width, height)
+    elif level_num == 2:
+        # Level 2: Cross pattern
+        generate_cross_layout(map_data, width, height)
+    elif level_num == 3:
+        # Level 3: Maze-like
+        generate_maze_layout(map_data, width, height)
+    elif level_num == 4:
+        # Level 4: Complex maze
+        generate_complex_maze(map_data, width, height)
+    else:
+        # Level 5+: Procedural generation
+        generate_procedural_layout(map_data, width, height, level_num)
+    return TileMap.from_rows(map_data)
+
+def generate_simple_layout(map_data, width, height):
+    """Level 1: Simple layout with few obstacles"""
+    # Create a simple, clean layout
+    # Corner obstacles
+    for i in range(3, 6):
+        map_data[3][i] = 2  # Top left
+        map_data[height-4][i] = 2  # Bottom left
+    for i in range(width-6, width-3):
+        map_data[3][i] = 2  # Top right
+        map_data[height-4][i] = 2  # Bottom right
+    
+    # Center obstacles
+    obstacles = [(8, 6), (15, 8), (22, 12), (10, 14)]
+    for x, y in obstacles:
+        if 0 < x < width-1 and 0 < y < height-1:
+            map_data[y][x] = 2
+    return map_data
+
+def generate_cross_layout(map_data, width, height):
+    """Level 2: Cross pattern with gaps"""
+    # Horizontal line with strategic gaps
+    for i in range(6, 24):
+        if i not in [10, 11, 12, 13, 14, 15]:  # Leave gaps for movement
+            map_data[height//2][i] = 2
+    
+    # Vertical line with gaps
+    for i in range(4, 16):
+        if i not in [8, 9, 10, 11]:  # Leave gaps for movement
+            map_data[i][width//2] = 2
+    
+    # Corner barriers
+    for i in range(2, 5):
+        map_data[2][i] = 2
+        map_data[height-3][i] = 2
+        map_data[2][width-1-i] = 2
+        map_data[height-3][width-1-i] = 2
+    return map_data
+
+def generate_maze_layout(map_data, width, height):
+    """Level 3: Structured maze with clear paths"""
+    # Create a proper maze with clear corridors
+    # Horizontal walls with gaps
+    for i in range(2, width-2, 4):
+        for j in range(3, height-3):
+            if j % 4 != 0:  # Leave gaps every 4th row
+                map_data[j][i] = 2
+    
+    # Vertical walls with gaps
+    for j in range(2, height-2, 4):
+        for i in range(3, width-3):
+            if i % 4 != 0:  # Leave gaps every 4th column
+                map_data[j][i] = 2
+    
+    # Strategic pillars
+    pillars = [(6, 6), (12, 10), (18, 8), (24, 12)]
+    for x, y in pillars:
+        if 0 < x < width-1 and 0 < y < height-1:
+            map_data[y][x] = 2
+    return map_data
+
+def generate_complex_maze(map_data, width, height):
+    """Level 4: Complex but navigable maze"""
+    # Outer ring of obstacles
+    for i in range(3, width-3):
+        if i % 3 == 0:
+            map_data[3][i] = 2
+            map_data[height-4][i] = 2
+    
+    for j in range(3, height-3):
+        if j % 3 == 0:
+            map_data[j][3] = 2
+            map_data[j][width-4] = 2
+    
+    # Inner structured obstacles
+    for i in range(6, width-6, 3):
+        for j in range(6, height-6, 3):
+            if (i + j) % 6 == 0:  # Deterministic pattern
+                map_data[j][i] = 2
+                if i+1 < width-1:
+                    map_data[j][i+1] = 2
+                if j+1 < height-1:
+                    map_data[j+1][i] = 2
+    
+    # Ensure main paths are clear
+    for i in range(8, width-8, 6):
+        for j in range(8, height-8, 6):
+            map_data[j][i] = 0
+            map_data[j][i+1] = 0
+            map_data[j+1][i] = 0
+    return map_data
+
+def generate_procedural_layout(map_data, width, height, level_num):
+    """Level 5+: Deterministic complex layouts"""
+    # Use deterministic patterns based on level number
+    # Level 5: Spiral pattern
+    if level_num == 5:
+        # Create spiral obstacles
+        for i in range(4, width-4, 2):
+            for j in range(4, height-4, 2):
+                if (i + j) % 4 == 0:
+                    map_data[j][i] = 2
+                    if i+1 < width-1:
+                        map_data[j][i+1] = 2
+                    if j+1 < height-1:
+                        map_data[j+1][i] = 2
+    
+    # Level 6: Diamond pattern
+    elif level_num == 6:
+        center_x, center_y = width // 2, height // 2
+        for i in range(2, width-2):
+            for j in range(2, height-2):
+                if abs(i - center_x) + abs(j - center_y) < 8:
+                    if (i + j) % 3 == 0:
+                        map_data[j][i] = 2
+    
+    # Level 7: Grid pattern
+    elif level_num == 7:
+        for i in range(3, width-3, 3):
+            for j in range(3, height-3, 3):
+                if (i + j) % 6 == 0:
+                    map_data[j][i] = 2
+                    if i+1 < width-1:
+                        map_data[j][i+1] = 2
+                    if j+1 < height-1:
+                        map_data[j+1][i] = 2
+                        map_data[j+1][i+1] = 2
+    
+    # Level 8+: Complex deterministic patterns
+    else:
+        # Create complex but navigable patterns
+        for i in range(2, width-2, 2):
+            for j in range(2, height-2, 2):
+                if (i * j) % (level_num + 3) == 0:
+                    map_data[j][i] = 2
+                    if i+1 < width-1:
+                        map_data[j][i+1] = 2
+                    if j+1 < height-1:
+                        map_data[j+1][i] = 2
+    
+    # Ensure main paths are always clear
+    for i in range(4, width-4, 4):
+        for j in range(4, height-4, 4):
+            map_data[j][i] = 0
+            if i+1 < width-1:
+                map_data[j][i+1] = 0
+            if j+1 < height-1:
+                map_data[j+1][i] = 0
+                map_data[j+1][i+1] = 0
+    
+    return map_data
+
+if __name__ == "__main__":
+    # Export the generated levels: python levels.py DIRECTORY [LAST_LEVEL]
+    last_level = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    export_levels(sys.argv[1], range(1, last_level + 1))
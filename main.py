@@ -1,6 +1,19 @@
 import pygame
 import random
 import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from capture import FrameRecorder
+from governor import QualityGovernor, QualityTier
+from levels import (OPENING_SPAWNS, POWERUP_TYPES, SPAWN_GHOST, SPAWN_GOLD, SPAWN_PLAYER, SPAWN_POWERUP,
+                    SPAWN_ZOMBIE, LevelFile, generate_level_layout, level_path, validate_level)
+from particles import ParticleSystem
+from projectiles import ProjectileSystem
+from render import (Renderer, BACKGROUND_LAYER, PROJECTILE_LAYER, PARTICLE_LAYER, OVERLAY_LAYER,
+                    HUD_BACK, HUD_FILL, HUD_FRAME, HUD_TEXT)
+from telemetry import Telemetry
+from timers import TimerWheel
 
 # Initialize pygame
 pygame.init()
@@ -15,11 +28,53 @@ GOLD = (255, 215, 0)
 PLAYER_SPEED = 5
 ZOMBIE_SPEED = 2
 TILE_SIZE = 40
+LEVEL_DIR = "maps"  # Level files here replace the generated layouts
+PROJECTILE_SPEED = 10
+PROJECTILE_DAMAGE = 10
+PROJECTILE_LIFE = 90  # Frames
+FIRE_COOLDOWN = 250  # ms
+SHOTGUN_SPREAD = 0.6  # Radians either side of the aim direction
+MAX_PROJECTILES = 8192
+MAX_PARTICLES = 32768
+HUD_WIDTH = 260  # Every HUD element is drawn left of this
+FRAME_SPIKE_MS = 2 * 1000 // FPS  # Frames slower than this are logged
 
 # Initialize Screen - Windowed mode
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Dungeons & Zombies - Enhanced Edition")
 clock = pygame.time.Clock()
+renderer = Renderer(screen)
+
+# Game-time scheduler for cooldowns and effect expiry, frozen while paused
+timers = TimerWheel()
+
+# Player projectiles, stored as arrays rather than sprites
+projectiles = ProjectileSystem(MAX_PROJECTILES, TILE_SIZE)
+
+# Hit, pickup and death effects, colors keyed by what emits them
+particles = ParticleSystem(MAX_PARTICLES, {
+    "blood": (220, 30, 30),
+    "gold": GOLD,
+    "health": (255, 0, 0),
+    "speed": (0, 255, 0),
+    "damage": (255, 255, 0),
+    "shotgun": (255, 0, 255),
+    "shield": (0, 0, 255),
+    "zombie": (110, 170, 110),
+    "ghost": (220, 220, 255),
+})
+
+# Quality tiers, from full quality down to what weak machines can hold at FPS
+quality_tiers = [
+    QualityTier("high", animation_interval=1, ai_interval=1, particle_cap=MAX_PARTICLES, hud_interval=1, dirty_rects=False),
+    QualityTier("medium", animation_interval=2, ai_interval=1, particle_cap=8192, hud_interval=2, dirty_rects=False),
+    QualityTier("low", animation_interval=3, ai_interval=2, particle_cap=2048, hud_interval=4, dirty_rects=True),
+    QualityTier("minimum", animation_interval=4, ai_interval=3, particle_cap=512, hud_interval=8, dirty_rects=True),
+]
+governor = QualityGovernor(quality_tiers, 1000 / FPS)
+
+# Session event log, written to disk by a background thread
+telemetry = Telemetry()
 
 # Load Assets
 wall_img = pygame.image.load('images/Dungeon Side Wall.png').convert_alpha()
@@ -37,194 +92,12 @@ player_img = pygame.transform.scale(player_img, (40, 40))
 ghost_img = pygame.image.load('images/ghost.png').convert_alpha()
 ghost_img = pygame.transform.scale(ghost_img, (40, 40))
 
-def draw_text(text, size, x, y, color=WHITE):
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
-    screen.blit(text_surface, (x, y))
+projectile_img = pygame.Surface((6, 6))
+projectile_img.fill((255, 240, 120))
 
-# Level Generation System
-def generate_level_layout(level_num):
-    """Generate different layouts for each level with increasing difficulty"""
-    width, height = 30, 20  # Grid size
-    map_data = [[0 for _ in range(width)] for _ in range(height)]
-    
-    # Add borders
-    for i in range(width):
-        map_data[0][i] = 1
-        map_data[height-1][i] = 1
-    for i in range(height):
-        map_data[i][0] = 1
-        map_data[i][width-1] = 1
-    
-    if level_num == 1:
-        # Level 1: Simple layout with few obstacles
-        return generate_simple_layout(map_data, width, height)
-    elif level_num == 2:
-        # Level 2: Cross pattern
-        return generate_cross_layout(map_data, width, height)
-    elif level_num == 3:
-        # Level 3: Maze-like
-        return generate_maze_layout(map_data, width, height)
-    elif level_num == 4:
-        # Level 4: Complex maze
-        return generate_complex_maze(map_data, width, height)
-    else:
-        # Level 5+: Procedural generation
-        return generate_procedural_layout(map_data, width, height, level_num)
-
-def generate_simple_layout(map_data, width, height):
-    """Level 1: Simple layout with few obstacles"""
-    # Create a simple, clean layout
-    # Corner obstacles
-    for i in range(3, 6):
-        map_data[3][i] = 2  # Top left
-        map_data[height-4][i] = 2  # Bottom left
-    for i in range(width-6, width-3):
-        map_data[3][i] = 2  # Top right
-        map_data[height-4][i] = 2  # Bottom right
-    
-    # Center obstacles
-    obstacles = [(8, 6), (15, 8), (22, 12), (10, 14)]
-    for x, y in obstacles:
-        if 0 < x < width-1 and 0 < y < height-1:
-            map_data[y][x] = 2
-    return map_data
-
-def generate_cross_layout(map_data, width, height):
-    """Level 2: Cross pattern with gaps"""
-    # Horizontal line with strategic gaps
-    for i in range(6, 24):
-        if i not in [10, 11, 12, 13, 14, 15]:  # Leave gaps for movement
-            map_data[height//2][i] = 2
-    
-    # Vertical line with gaps
-    for i in range(4, 16):
-        if i not in [8, 9, 10, 11]:  # Leave gaps for movement
-            map_data[i][width//2] = 2
-    
-    # Corner barriers
-    for i in range(2, 5):
-        map_data[2][i] = 2
-        map_data[height-3][i] = 2
-        map_data[2][width-1-i] = 2
-        map_data[height-3][width-1-i] = 2
-    return map_data
-
-def generate_maze_layout(map_data, width, height):
-    """Level 3: Structured maze with clear paths"""
-    # Create a proper maze with clear corridors
-    # Horizontal walls with gaps
-    for i in range(2, width-2, 4):
-        for j in range(3, height-3):
-            if j % 4 != 0:  # Leave gaps every 4th row
-                map_data[j][i] = 2
-    
-    # Vertical walls with gaps
-    for j in range(2, height-2, 4):
-        for i in range(3, width-3):
-            if i % 4 != 0:  # Leave gaps every 4th column
-                map_data[j][i] = 2
-    
-    # Strategic pillars
-    pillars = [(6, 6), (12, 10), (18, 8), (24, 12)]
-    for x, y in pillars:
-        if 0 < x < width-1 and 0 < y < height-1:
-            map_data[y][x] = 2
-    return map_data
-
-def generate_complex_maze(map_data, width, height):
-    """Level 4: Complex but navigable maze"""
-    # Outer ring of obstacles
-    for i in range(3, width-3):
-        if i % 3 == 0:
-            map_data[3][i] = 2
-            map_data[height-4][i] = 2
-    
-    for j in range(3, height-3):
-        if j % 3 == 0:
-            map_data[j][3] = 2
-            map_data[j][width-4] = 2
-    
-    # Inner structured obstacles
-    for i in range(6, width-6, 3):
-        for j in range(6, height-6, 3):
-            if (i + j) % 6 == 0:  # Deterministic pattern
-                map_data[j][i] = 2
-                if i+1 < width-1:
-                    map_data[j][i+1] = 2
-                if j+1 < height-1:
-                    map_data[j+1][i] = 2
-    
-    # Ensure main paths are clear
-    for i in range(8, width-8, 6):
-        for j in range(8, height-8, 6):
-            map_data[j][i] = 0
-            map_data[j][i+1] = 0
-            map_data[j+1][i] = 0
-    return map_data
-
-def generate_procedural_layout(map_data, width, height, level_num):
-    """Level 5+: Deterministic complex layouts"""
-    # Use deterministic patterns based on level number
-    # Level 5: Spiral pattern
-    if level_num == 5:
-        # Create spiral obstacles
-        for i in range(4, width-4, 2):
-            for j in range(4, height-4, 2):
-                if (i + j) % 4 == 0:
-                    map_data[j][i] = 2
-                    if i+1 < width-1:
-                        map_data[j][i+1] = 2
-                    if j+1 < height-1:
-                        map_data[j+1][i] = 2
-    
-    # Level 6: Diamond pattern
-    elif level_num == 6:
-        center_x, center_y = width // 2, height // 2
-        for i in range(2, width-2):
-            for j in range(2, height-2):
-                if abs(i - center_x) + abs(j - center_y) < 8:
-                    if (i + j) % 3 == 0:
-                        map_data[j][i] = 2
-    
-    # Level 7: Grid pattern
-    elif level_num == 7:
-        for i in range(3, width-3, 3):
-            for j in range(3, height-3, 3):
-                if (i + j) % 6 == 0:
-                    map_data[j][i] = 2
-                    if i+1 < width-1:
-                        map_data[j][i+1] = 2
-                    if j+1 < height-1:
-                        map_data[j+1][i] = 2
-                        map_data[j+1][i+1] = 2
-    
-    # Level 8+: Complex deterministic patterns
-    else:
-        # Create complex but navigable patterns
-        for i in range(2, width-2, 2):
-            for j in range(2, height-2, 2):
-                if (i * j) % (level_num + 3) == 0:
-                    map_data[j][i] = 2
-                    if i+1 < width-1:
-                        map_data[j][i+1] = 2
-                    if j+1 < height-1:
-                        map_data[j+1][i] = 2
-    
-    # Ensure main paths are always clear
-    for i in range(4, width-4, 4):
-        for j in range(4, height-4, 4):
-            map_data[j][i] = 0
-            if i+1 < width-1:
-                map_data[j][i+1] = 0
-            if j+1 < height-1:
-                map_data[j+1][i] = 0
-                map_data[j+1][i+1] = 0
-    
-    return map_data
-
-# Generate initial level
-current_level_map = generate_level_layout(1)
+def draw_text(text, size, x, y, color=WHITE, target=None):
+    target = target or renderer
+    target.add(target.text(text, size, color), (x, y), HUD_TEXT)
 
 # Wall Class
 class Wall(pygame.sprite.Sprite):
@@ -251,9 +124,13 @@ class Player(pygame.sprite.Sprite):
         self.max_health = 100
         self.speed_boost = 0
         self.damage_boost = 1
+        self.shotgun = 0
         self.shield_active = False
+        self.facing = (1, 0)
+        self.fire_ready = True
         self.invulnerable = False
-        self.invulnerability_timer = 0
+        self.invulnerability_timer = None
+        self.effect_timers = {}
 
     def update(self):
         keys = pygame.key.get_pressed()
@@ -266,6 +143,10 @@ class Player(pygame.sprite.Sprite):
             dy = -(PLAYER_SPEED + self.speed_boost)
         if keys[pygame.K_DOWN]:
             dy = PLAYER_SPEED + self.speed_boost
+        if dx or dy:
+            self.facing = ((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+        if keys[pygame.K_SPACE] and self.fire_ready:
+            self.fire()
 
         # Move horizontally and check collisions
         self.rect.x += dx
@@ -280,24 +161,78 @@ class Player(pygame.sprite.Sprite):
             pygame.sprite.spritecollide(self, small_walls, False) or
             self.rect.top < 0 or self.rect.bottom > HEIGHT):
             self.rect.y -= dy
-        
-        # Update invulnerability
-        if self.invulnerable:
-            current_time = pygame.time.get_ticks()
-            if current_time >= self.invulnerability_timer:
-                self.invulnerable = False
 
     def take_damage(self, damage):
         if not self.invulnerable and not self.shield_active:
             self.health -= damage
+            telemetry.emit("damage", amount=damage, health=self.health)
+            particles.burst(self.rect.centerx, self.rect.centery, 24, "blood")
             if self.health <= 0:
                 return True  # Player died
             else:
                 # Make player temporarily invulnerable
                 self.invulnerable = True
-                self.invulnerability_timer = pygame.time.get_ticks() + 1000  # 1 second
+                timers.cancel(self.invulnerability_timer)
+                self.invulnerability_timer = timers.schedule(1000, self.end_invulnerability)  # 1 second
         return False
 
+    def fire(self):
+        """Shoot in the facing direction, a spread while shotgun is active"""
+        angle = math.atan2(self.facing[1], self.facing[0])
+        if self.shotgun:
+            step = 2 * SHOTGUN_SPREAD / max(1, self.shotgun - 1)
+            angles = [angle - SHOTGUN_SPREAD + i * step for i in range(self.shotgun)]
+        else:
+            angles = [angle]
+        projectiles.fire(self.rect.centerx, self.rect.centery, angles, PROJECTILE_SPEED,
+                         PROJECTILE_DAMAGE * self.damage_boost, PROJECTILE_LIFE)
+        self.fire_ready = False
+        timers.schedule(FIRE_COOLDOWN, self.reset_fire)
+
+    def reset_fire(self):
+        self.fire_ready = True
+
+    def end_invulnerability(self):
+        self.invulnerable = False
+        self.invulnerability_timer = None
+
+    def apply_powerup(self, powerup):
+        """Apply a power-up and schedule the expiry of timed effects"""
+        if powerup.powerup_type == "health":
+            self.health = min(self.max_health, self.health + powerup.value)
+            return
+        if powerup.powerup_type == "speed":
+            self.speed_boost = powerup.value
+        elif powerup.powerup_type == "damage":
+            self.damage_boost = powerup.value
+        elif powerup.powerup_type == "shotgun":
+            self.shotgun = powerup.value
+        elif powerup.powerup_type == "shield":
+            self.shield_active = True
+        # Picking up the same power-up again restarts its duration
+        timers.cancel(self.effect_timers.get(powerup.powerup_type))
+        self.effect_timers[powerup.powerup_type] = timers.schedule(
+            powerup.duration, self.expire_powerup, powerup.powerup_type)
+
+    def expire_powerup(self, powerup_type):
+        self.effect_timers.pop(powerup_type, None)
+        if powerup_type == "speed":
+            self.speed_boost = 0
+        elif powerup_type == "damage":
+            self.damage_boost = 1
+        elif powerup_type == "shotgun":
+            self.shotgun = 0
+        elif powerup_type == "shield":
+            self.shield_active = False
+
+    def clear_effects(self):
+        """Drop all active power-ups and invulnerability"""
+        for powerup_type in list(self.effect_timers):
+            timers.cancel(self.effect_timers[powerup_type])
+            self.expire_powerup(powerup_type)
+        timers.cancel(self.invulnerability_timer)
+        self.end_invulnerability()
+
 # Enhanced Zombie Class with AI
 class Zombie(pygame.sprite.Sprite):
     def __init__(self, spawn_x, spawn_y):
@@ -306,10 +241,11 @@ class Zombie(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=(spawn_x, spawn_y))
         self.health = 50
         self.damage = 15
+        self.score_value = 25
         self.attack_cooldown = 0
-        self.last_attack_time = 0
+        self.attack_ready = True
 
-    def update(self):
+    def update(self, steps=1):
         # Calculate direction to player
         dx = player.rect.centerx - self.rect.centerx
         dy = player.rect.centery - self.rect.centery
@@ -320,26 +256,33 @@ class Zombie(pygame.sprite.Sprite):
             dx /= distance
             dy /= distance
             
-            # Move towards player
-            self.rect.x += dx * ZOMBIE_SPEED
-            self.rect.y += dy * ZOMBIE_SPEED
+            # Move towards player, covering every frame since the last update
+            speed = ZOMBIE_SPEED * steps
+            self.rect.x += dx * speed
+            self.rect.y += dy * speed
             
             # Check wall collisions
             if (pygame.sprite.spritecollide(self, walls, False) or
                 pygame.sprite.spritecollide(self, small_walls, False)):
-                self.rect.x -= dx * ZOMBIE_SPEED
-                self.rect.y -= dy * ZOMBIE_SPEED
+                self.rect.x -= dx * speed
+                self.rect.y -= dy * speed
 
     def can_attack(self, player):
-        current_time = pygame.time.get_ticks()
+        if not self.attack_ready:
+            return False
         distance = math.sqrt((player.rect.centerx - self.rect.centerx)**2 + 
                            (player.rect.centery - self.rect.centery)**2)
         
-        if distance < 50 and current_time - self.last_attack_time > self.attack_cooldown:
-            self.last_attack_time = current_time
+        if distance < 50:
+            if self.attack_cooldown > 0:
+                self.attack_ready = False
+                timers.schedule(self.attack_cooldown, self.reset_attack)
             return True
         return False
 
+    def reset_attack(self):
+        self.attack_ready = True
+
 # Ghost Class with phase ability
 class Ghost(pygame.sprite.Sprite):
     def __init__(self, spawn_x, spawn_y):
@@ -348,12 +291,13 @@ class Ghost(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=(spawn_x, spawn_y))
         self.health = 30
         self.damage = 10
+        self.score_value = 20
         self.speed = 3
         self.attack_cooldown = 0
-        self.last_attack_time = 0
+        self.attack_ready = True
         self.can_phase = True
 
-    def update(self):
+    def update(self, steps=1):
         # Calculate direction to player
         dx = player.rect.centerx - self.rect.centerx
         dy = player.rect.centery - self.rect.centery
@@ -364,25 +308,32 @@ class Ghost(pygame.sprite.Sprite):
             dx /= distance
             dy /= distance
             
-            # Move towards player
-            self.rect.x += dx * self.speed
-            self.rect.y += dy * self.speed
+            # Move towards player, covering every frame since the last update
+            speed = self.speed * steps
+            self.rect.x += dx * speed
+            self.rect.y += dy * speed
             
             # Ghosts can phase through small walls but not main walls
             if pygame.sprite.spritecollide(self, walls, False):
-                self.rect.x -= dx * self.speed
-                self.rect.y -= dy * self.speed
+                self.rect.x -= dx * speed
+                self.rect.y -= dy * speed
 
     def can_attack(self, player):
-        current_time = pygame.time.get_ticks()
+        if not self.attack_ready:
+            return False
         distance = math.sqrt((player.rect.centerx - self.rect.centerx)**2 + 
                            (player.rect.centery - self.rect.centery)**2)
         
-        if distance < 50 and current_time - self.last_attack_time > self.attack_cooldown:
-            self.last_attack_time = current_time
+        if distance < 50:
+            if self.attack_cooldown > 0:
+                self.attack_ready = False
+                timers.schedule(self.attack_cooldown, self.reset_attack)
             return True
         return False
 
+    def reset_attack(self):
+        self.attack_ready = True
+
 # Gold Bar Class
 class Gold(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -394,9 +345,9 @@ class Gold(pygame.sprite.Sprite):
         self.animation_frame = 0
         self.animation_speed = 0.15
         
-    def update(self):
+    def update(self, steps=1):
         # Spinning animation
-        self.animation_frame += self.animation_speed
+        self.animation_frame += self.animation_speed * steps
         if self.animation_frame >= 2 * math.pi:
             self.animation_frame = 0
         
@@ -430,6 +381,11 @@ class PowerUp(pygame.sprite.Sprite):
             self.image.fill((255, 255, 0))
             self.value = 1.5
             self.duration = 15000  # 15 seconds
+        elif powerup_type == "shotgun":
+            self.image = pygame.Surface((25, 25))
+            self.image.fill((255, 0, 255))
+            self.value = 24  # Pellets per shot
+            self.duration = 10000  # 10 seconds
         elif powerup_type == "shield":
             self.image = pygame.Surface((25, 25))
             self.image.fill((0, 0, 255))
@@ -439,9 +395,9 @@ class PowerUp(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=(x, y))
         self.original_image = self.image.copy()
         
-    def update(self):
+    def update(self, steps=1):
         # Animate powerup
-        self.animation_frame += self.animation_speed
+        self.animation_frame += self.animation_speed * steps
         if self.animation_frame >= 2 * math.pi:
             self.animation_frame = 0
         
@@ -472,125 +428,172 @@ class GameManager:
         self.required_coins = 3
         self.lives = 3
 
-def spawn_new_level():
-    """Spawn new level with more enemies and coins"""
-    global all_sprites, zombies, ghosts, gold_bars, powerups, walls, small_walls, current_level_map, player
-    
-    # Clear existing entities
-    zombies.empty()
-    ghosts.empty()
-    gold_bars.empty()
-    powerups.empty()
-    walls.empty()
-    small_walls.empty()
-    
-    # Remove entities from all_sprites
-    for sprite in list(all_sprites):
-        if sprite != player:
-            all_sprites.remove(sprite)
-    
-    # Generate new level layout
-    current_level_map = generate_level_layout(game_manager.current_level)
-    
-    # Create walls from the new layout
-    for row_index, row in enumerate(current_level_map):
-        for col_index, tile in enumerate(row):
-            x, y = col_index * TILE_SIZE, row_index * TILE_SIZE
-            if tile == 1:  # Main walls
-                wall = Wall(x, y)
-                all_sprites.add(wall)
-                walls.add(wall)
-            elif tile == 2:  # Small walls/obstacles
-                small_wall = SmallWall(x, y)
-                all_sprites.add(small_wall)
-                small_walls.add(small_wall)
-    
-    # Move player to valid position
-    player_x, player_y = find_valid_spawn_position()
-    player.rect.centerx = player_x
-    player.rect.centery = player_y
-    
-    # Spawn more enemies based on level
-    enemy_count = 2 + game_manager.current_level
-    for i in range(enemy_count):
-        # Find valid spawn position (not on walls)
-        attempts = 0
-        while attempts < 100:
-            x = random.randint(100, WIDTH-100)
-            y = random.randint(100, HEIGHT-100)
-            # Check if position is clear
-            if not any(wall.rect.collidepoint(x, y) for wall in walls) and \
-               not any(swall.rect.collidepoint(x, y) for swall in small_walls):
-                if i % 2 == 0:  # Spawn zombies
-                    zombie = Zombie(x, y)
-                    all_sprites.add(zombie)
-                    zombies.add(zombie)
-                else:  # Spawn ghosts
-                    ghost = Ghost(x, y)
-                    all_sprites.add(ghost)
-                    ghosts.add(ghost)
-                break
-            attempts += 1
-    
-    # Spawn coins
-    coin_count = game_manager.required_coins
-    for i in range(coin_count):
-        # Find valid spawn position
+class Level:
+    """Map, collision groups, baked background and entities for one level"""
+    def __init__(self, map_data):
+        self.map_data = map_data
+        self.sprites = pygame.sprite.Group()
+        self.zombies = pygame.sprite.Group()
+        self.ghosts = pygame.sprite.Group()
+        self.gold_bars = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.walls = pygame.sprite.Group()
+        self.small_walls = pygame.sprite.Group()
+        self.player_spawn = (WIDTH // 2, HEIGHT // 2)
+        
+        # Walls never move, so they are drawn once into the background
+        self.background = pygame.Surface((WIDTH, HEIGHT))
+        self.background.fill((20, 20, 40))
+        for row_index, row in enumerate(map_data):
+            for col_index, tile in enumerate(row):
+                x, y = col_index * TILE_SIZE, row_index * TILE_SIZE
+                if tile == 1:  # Main walls
+                    wall = Wall(x, y)
+                    self.walls.add(wall)
+                    self.background.blit(wall.image, wall.rect)
+                elif tile == 2:  # Small walls/obstacles
+                    small_wall = SmallWall(x, y)
+                    self.small_walls.add(small_wall)
+                    self.background.blit(small_wall.image, small_wall.rect)
+
+    def add(self, sprite, group):
+        self.sprites.add(sprite)
+        group.add(sprite)
+
+    def find_clear_position(self):
+        """Random point that is not inside a wall, or None"""
         attempts = 0
         while attempts < 100:
             x = random.randint(100, WIDTH-100)
             y = random.randint(100, HEIGHT-100)
             # Check if position is clear
-            if not any(wall.rect.collidepoint(x, y) for wall in walls) and \
-               not any(swall.rect.collidepoint(x, y) for swall in small_walls):
-                gold = Gold(x, y)
-                all_sprites.add(gold)
-                gold_bars.add(gold)
-                break
+            if not any(wall.rect.collidepoint(x, y) for wall in self.walls) and \
+               not any(swall.rect.collidepoint(x, y) for swall in self.small_walls):
+                return x, y
             attempts += 1
+        return None
+
+    def spawn_entities(self, level_num, required_coins):
+        """Place the player, enemies, coins and power-ups for a level"""
+        self.player_spawn = find_valid_spawn_position(self.walls, self.small_walls)
+        
+        # Spawn more enemies based on level
+        enemy_count = 2 + level_num
+        for i in range(enemy_count):
+            position = self.find_clear_position()
+            if position is None:
+                continue
+            if i % 2 == 0:  # Spawn zombies
+                self.add(Zombie(*position), self.zombies)
+            else:  # Spawn ghosts
+                self.add(Ghost(*position), self.ghosts)
+        
+        # Spawn coins
+        for i in range(required_coins):
+            position = self.find_clear_position()
+            if position is not None:
+                self.add(Gold(*position), self.gold_bars)
+        
+        # Spawn power-up (random chance)
+        if random.random() < 0.5:  # 50% chance
+            powerup_type = random.choice(POWERUP_TYPES)
+            position = self.find_clear_position()
+            if position is not None:
+                self.add(PowerUp(*position, powerup_type), self.powerups)
+
+    def spawn_from_file(self, spawns):
+        """Place entities at (kind, variant, x, y) spawn points, as stored in level files"""
+        self.player_spawn = None
+        for kind, variant, x, y in spawns:
+            if kind == SPAWN_PLAYER:
+                self.player_spawn = (x, y)
+            elif kind == SPAWN_ZOMBIE:
+                self.add(Zombie(x, y), self.zombies)
+            elif kind == SPAWN_GHOST:
+                self.add(Ghost(x, y), self.ghosts)
+            elif kind == SPAWN_GOLD:
+                self.add(Gold(x, y), self.gold_bars)
+            elif kind == SPAWN_POWERUP:
+                self.add(PowerUp(x, y, POWERUP_TYPES[variant]), self.powerups)
+        if self.player_spawn is None:
+            self.player_spawn = find_valid_spawn_position(self.walls, self.small_walls)
+
+def build_level(level_num, required_coins, opening=False):
+    """Load or generate a complete level, safe to run on the loader thread
+
+    With opening set, a generated level gets the fixed launch spawns.
+    """
+    path = level_path(LEVEL_DIR, level_num)
+    if os.path.exists(path):
+        level_file = LevelFile(path)
+        try:
+            # There is no camera, so a level file has to be exactly one screen of tiles
+            validate_level(level_file, WIDTH // TILE_SIZE, HEIGHT // TILE_SIZE, TILE_SIZE, required_coins)
+        except ValueError:
+            level_file.close()
+            raise
+        level = Level(level_file.tiles)
+        if level_file.spawn_count:
+            level.spawn_from_file(level_file.spawns())
+        else:
+            level.spawn_entities(level_num, required_coins)
+        return level
+    level = Level(generate_level_layout(level_num))
+    if opening:
+        level.spawn_from_file(OPENING_SPAWNS)
+    else:
+        level.spawn_entities(level_num, required_coins)
+    return level
+
+# Level Prefetching
+# The next level is built on a worker thread while the level complete or game
+# over screen is shown, so continuing only swaps the prepared level in.
+level_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-loader")
+prefetched_level = None  # ((level_num, required_coins), Future)
+
+def prefetch_level(level_num, required_coins):
+    global prefetched_level
+    key = (level_num, required_coins)
+    if prefetched_level is None or prefetched_level[0] != key:
+        prefetched_level = (key, level_loader.submit(build_level, level_num, required_coins))
+
+def take_level(level_num, required_coins):
+    """Prefetched level if it matches, otherwise build it now"""
+    global prefetched_level
+    prefetched, prefetched_level = prefetched_level, None
+    if prefetched is not None and prefetched[0] == (level_num, required_coins):
+        return prefetched[1].result()
+    return build_level(level_num, required_coins)
+
+def load_level(level):
+    """Make level the active one"""
+    global current_level, all_sprites, zombies, ghosts, gold_bars, powerups, walls, small_walls, current_level_map
+    current_level = level
+    current_level_map = level.map_data
+    all_sprites = level.sprites
+    zombies = level.zombies
+    ghosts = level.ghosts
+    gold_bars = level.gold_bars
+    powerups = level.powerups
+    walls = level.walls
+    small_walls = level.small_walls
+    projectiles.set_map(level.map_data)
+    particles.clear()
+
+def spawn_new_level():
+    """Spawn new level with more enemies and coins"""
+    level = take_level(game_manager.current_level, game_manager.required_coins)
+    load_level(level)
     
-    # Spawn power-up (random chance)
-    if random.random() < 0.5:  # 50% chance
-        powerup_type = random.choice(["health", "speed", "damage", "shield"])
-        # Find valid spawn position
-        attempts = 0
-        while attempts < 100:
-            x = random.randint(100, WIDTH-100)
-            y = random.randint(100, HEIGHT-100)
-            # Check if position is clear
-            if not any(wall.rect.collidepoint(x, y) for wall in walls) and \
-               not any(swall.rect.collidepoint(x, y) for swall in small_walls):
-                powerup = PowerUp(x, y, powerup_type)
-                all_sprites.add(powerup)
-                powerups.add(powerup)
-                break
-            attempts += 1
+    # Move player to valid position
+    player.rect.center = level.player_spawn
+    all_sprites.add(player)
 
 # Initialize Game
 game_manager = GameManager()
-all_sprites = pygame.sprite.Group()
-zombies = pygame.sprite.Group()
-ghosts = pygame.sprite.Group()
-gold_bars = pygame.sprite.Group()
-powerups = pygame.sprite.Group()
-walls = pygame.sprite.Group()
-small_walls = pygame.sprite.Group()
-
-# Create initial level
-for row_index, row in enumerate(current_level_map):
-    for col_index, tile in enumerate(row):
-        x, y = col_index * TILE_SIZE, row_index * TILE_SIZE
-        if tile == 1:  # Main walls
-            wall = Wall(x, y)
-            all_sprites.add(wall)
-            walls.add(wall)
-        elif tile == 2:  # Small walls/obstacles
-            sw = SmallWall(x, y)
-            all_sprites.add(sw)
-            small_walls.add(sw)
 
 # Find a valid spawn position for player
-def find_valid_spawn_position():
+def find_valid_spawn_position(walls, small_walls):
     """Find a clear position for player to spawn"""
     attempts = 0
     while attempts < 1000:
@@ -661,43 +664,32 @@ def find_valid_spawn_position():
     # Ultimate fallback
     return 100, 100
 
-# Spawn player in valid position
-player_x, player_y = find_valid_spawn_position()
-player = Player(player_x, player_y)
-all_sprites.add(player)
+# Create initial level, from its level file or else the fixed opening
+load_level(build_level(game_manager.current_level, game_manager.required_coins, opening=True))
 
-# Spawn Initial Enemies
-zombie1 = Zombie(800, 300)
-zombie2 = Zombie(1000, 500)
-ghost1 = Ghost(400, 200)
-all_sprites.add(zombie1, zombie2, ghost1)
-zombies.add(zombie1, zombie2)
-ghosts.add(ghost1)
-
-# Spawn Coins
-gold1 = Gold(500, 300)
-gold2 = Gold(700, 400)
-gold3 = Gold(900, 200)
-all_sprites.add(gold1, gold2, gold3)
-gold_bars.add(gold1, gold2, gold3)
-
-# Spawn Power-up
-powerup1 = PowerUp(600, 600, "speed")
-all_sprites.add(powerup1)
-powerups.add(powerup1)
+# Spawn player at the level's spawn point
+player = Player(*current_level.player_spawn)
+all_sprites.add(player)
 
 # UI Functions
-def draw_health_bar(screen, player, x, y):
+def build_panel(width, height, color, radius, border=0):
+    """Rounded rectangle on a transparent surface, filled or as an outline"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, (0, 0, width, height), border, border_radius=radius)
+    return surface
+
+def draw_health_bar(renderer, player, x, y):
     """Draw a beautiful health bar"""
     bar_width = 200
     bar_height = 25
     
     # Background
-    pygame.draw.rect(screen, (50, 50, 50), (x, y, bar_width, bar_height), border_radius=12)
+    renderer.add(renderer.cached("health_back", lambda: build_panel(bar_width, bar_height, (50, 50, 50), 12)),
+                 (x, y), HUD_BACK)
     
     # Health fill
     health_ratio = player.health / player.max_health
-    health_width = bar_width * health_ratio
+    health_width = int(bar_width * health_ratio)
     
     # Color based on health
     if health_ratio > 0.6:
@@ -707,26 +699,30 @@ def draw_health_bar(screen, player, x, y):
     else:
         color = (255, 0, 0)  # Red
     
-    pygame.draw.rect(screen, color, (x, y, health_width, bar_height), border_radius=12)
+    if health_width > 0:
+        renderer.add(renderer.cached(("health_fill", color, health_width),
+                                     lambda: build_panel(health_width, bar_height, color, 12)),
+                     (x, y), HUD_FILL)
     
     # Border
-    pygame.draw.rect(screen, (255, 255, 255), (x, y, bar_width, bar_height), 3, border_radius=12)
+    renderer.add(renderer.cached("health_frame", lambda: build_panel(bar_width, bar_height, (255, 255, 255), 12, 3)),
+                 (x, y), HUD_FRAME)
     
     # Health text
     health_text = f"{player.health}/{player.max_health}"
-    font = pygame.font.Font(None, 24)
-    text_surface = font.render(health_text, True, (255, 255, 255))
+    text_surface = renderer.text(health_text, 24, (255, 255, 255))
     text_rect = text_surface.get_rect(center=(x + bar_width//2, y + bar_height//2))
-    screen.blit(text_surface, text_rect)
+    renderer.add(text_surface, text_rect, HUD_TEXT)
 
-def draw_coin_counter(screen, coins_collected, required_coins, x, y):
+def draw_coin_counter(renderer, coins_collected, required_coins, x, y):
     """Draw coin counter with progress"""
     # Background
-    pygame.draw.rect(screen, (50, 50, 50), (x, y, 250, 30), border_radius=15)
+    renderer.add(renderer.cached("coin_back", lambda: build_panel(250, 30, (50, 50, 50), 15)),
+                 (x, y), HUD_BACK)
     
     # Progress bar
     progress = coins_collected / required_coins if required_coins > 0 else 0
-    progress_width = 250 * min(progress, 1.0)
+    progress_width = int(250 * min(progress, 1.0))
     
     # Color based on progress
     if progress >= 1.0:
@@ -734,48 +730,101 @@ def draw_coin_counter(screen, coins_collected, required_coins, x, y):
     else:
         color = (255, 165, 0)  # Orange
     
-    pygame.draw.rect(screen, color, (x, y, progress_width, 30), border_radius=15)
+    if progress_width > 0:
+        renderer.add(renderer.cached(("coin_fill", color, progress_width),
+                                     lambda: build_panel(progress_width, 30, color, 15)),
+                     (x, y), HUD_FILL)
     
     # Border
-    pygame.draw.rect(screen, (255, 255, 255), (x, y, 250, 30), 2, border_radius=15)
+    renderer.add(renderer.cached("coin_frame", lambda: build_panel(250, 30, (255, 255, 255), 15, 2)),
+                 (x, y), HUD_FRAME)
     
     # Coin text
     coin_text = f"💰 {coins_collected}/{required_coins}"
-    font = pygame.font.Font(None, 24)
-    text_surface = font.render(coin_text, True, (255, 255, 255))
+    text_surface = renderer.text(coin_text, 24, (255, 255, 255))
     text_rect = text_surface.get_rect(center=(x + 125, y + 15))
-    screen.blit(text_surface, text_rect)
+    renderer.add(text_surface, text_rect, HUD_TEXT)
 
-def draw_powerup_indicators(screen, player, x, y):
+def draw_powerup_indicators(renderer, player, x, y):
     """Draw active powerup indicators"""
+    background = renderer.cached("powerup_back", lambda: build_panel(200, 25, (30, 30, 30), 12))
     y_offset = 0
     if player.speed_boost > 0:
-        pygame.draw.rect(screen, (30, 30, 30), (x, y + y_offset, 200, 25), border_radius=12)
+        renderer.add(background, (x, y + y_offset), HUD_BACK)
         text = f"⚡ Speed Boost: {player.speed_boost}x"
-        font = pygame.font.Font(None, 20)
-        text_surface = font.render(text, True, (0, 255, 0))
-        screen.blit(text_surface, (x + 10, y + y_offset + 5))
+        renderer.add(renderer.text(text, 20, (0, 255, 0)), (x + 10, y + y_offset + 5), HUD_TEXT)
         y_offset += 30
     
     if player.damage_boost > 1:
-        pygame.draw.rect(screen, (30, 30, 30), (x, y + y_offset, 200, 25), border_radius=12)
+        renderer.add(background, (x, y + y_offset), HUD_BACK)
         text = f"⚔️ Damage Boost: {player.damage_boost}x"
-        font = pygame.font.Font(None, 20)
-        text_surface = font.render(text, True, (255, 255, 0))
-        screen.blit(text_surface, (x + 10, y + y_offset + 5))
+        renderer.add(renderer.text(text, 20, (255, 255, 0)), (x + 10, y + y_offset + 5), HUD_TEXT)
+        y_offset += 30
+    
+    if player.shotgun:
+        renderer.add(background, (x, y + y_offset), HUD_BACK)
+        text = f"💥 Shotgun: {player.shotgun} pellets"
+        renderer.add(renderer.text(text, 20, (255, 0, 255)), (x + 10, y + y_offset + 5), HUD_TEXT)
         y_offset += 30
     
     if player.shield_active:
-        pygame.draw.rect(screen, (30, 30, 30), (x, y + y_offset, 200, 25), border_radius=12)
+        renderer.add(background, (x, y + y_offset), HUD_BACK)
         text = "🛡️ Shield Active"
-        font = pygame.font.Font(None, 20)
-        text_surface = font.render(text, True, (0, 0, 255))
-        screen.blit(text_surface, (x + 10, y + y_offset + 5))
+        renderer.add(renderer.text(text, 20, (0, 0, 255)), (x + 10, y + y_offset + 5), HUD_TEXT)
+
+def draw_hud(target):
+    """Draw the in-game HUD with the given renderer"""
+    draw_health_bar(target, player, 10, 10)
+    draw_coin_counter(target, game_manager.coins_collected, game_manager.required_coins, 10, 50)
+    draw_powerup_indicators(target, player, 10, 90)
+    
+    # Score and Level
+    draw_text(f"Score: {game_manager.score}", 30, 10, HEIGHT - 60, target=target)
+    draw_text(f"Level: {game_manager.current_level}", 30, 10, HEIGHT - 30, target=target)
+
+# HUD cache for quality tiers that redraw it only every few frames
+hud_surface = pygame.Surface((HUD_WIDTH, HEIGHT), pygame.SRCALPHA)
+hud_renderer = Renderer(hud_surface)
+hud_drawn_at = -1
+
+# Session recording, F12 toggles it and --record starts it at launch
+def start_recording():
+    global recorder
+    recorder = FrameRecorder(screen, fps=FPS)
+    telemetry.emit("recording_start")
+
+def stop_recording():
+    global recorder, stopped_recorders
+    # The writer finishes its queued frames in the background, joined at exit
+    recorder.stop()
+    stopped_recorders = [stopped for stopped in stopped_recorders if stopped.thread.is_alive()]
+    stopped_recorders.append(recorder)
+    telemetry.emit("recording_stop", frames=recorder.frame_index, dropped=recorder.dropped)
+    recorder = None
+
+recorder = None
+stopped_recorders = []
+if "--record" in sys.argv:
+    start_recording()
+
+# Semi-transparent overlay for the pause screen
+pause_overlay = pygame.Surface((WIDTH, HEIGHT))
+pause_overlay.set_alpha(128)
+pause_overlay.fill((0, 0, 0))
 
 # Game Loop
+telemetry.emit("session_start", level=game_manager.current_level)
+dirty_rects = None  # Areas drawn last frame while updating only dirty rects
 running = True
 while running:
-    clock.tick(FPS)
+    dt = clock.tick(FPS)
+    if dt > FRAME_SPIKE_MS:
+        telemetry.emit("frame_spike", ms=dt, state=game_manager.current_state)
+    # Adjust quality from the time spent working, not sleeping, last frame
+    if governor.record(clock.get_rawtime()):
+        particles.set_limit(governor.tier.particle_cap)
+        telemetry.emit("quality_tier", **governor.metrics())
+    tier = governor.tier
 
     # Event Handling
     for event in pygame.event.get():
@@ -785,8 +834,10 @@ while running:
             if event.key == pygame.K_ESCAPE:
                 if game_manager.current_state == GameState.PLAYING:
                     game_manager.current_state = GameState.PAUSED
+                    timers.pause()
                 elif game_manager.current_state == GameState.PAUSED:
                     game_manager.current_state = GameState.PLAYING
+                    timers.resume()
                 elif game_manager.current_state == GameState.LEVEL_COMPLETE:
                     # Continue to next level
                     game_manager.current_level += 1
@@ -805,71 +856,119 @@ while running:
                     game_manager.score = 0
                     game_manager.current_state = GameState.PLAYING
                     player.health = player.max_health
+                    # Pending cooldowns belong to the old game, drop them all
+                    timers.clear()
+                    player.clear_effects()
+                    player.reset_fire()
                     spawn_new_level()
+            elif event.key == pygame.K_F12:
+                if recorder is None:
+                    start_recording()
+                else:
+                    stop_recording()
 
     # Update
     if game_manager.current_state == GameState.PLAYING:
-        all_sprites.update()
+        # Fire cooldowns and effect expirations that came due this frame
+        timers.advance(dt)
+        player.update()
+        if governor.due(tier.ai_interval):
+            zombies.update(tier.ai_interval)
+            ghosts.update(tier.ai_interval)
+        if governor.due(tier.animation_interval):
+            gold_bars.update(tier.animation_interval)
+            powerups.update(tier.animation_interval)
+
+        # Projectiles vs walls and enemies
+        enemies = zombies.sprites() + ghosts.sprites()
+        damage_taken = projectiles.update([(enemy.rect.left, enemy.rect.top, enemy.rect.right, enemy.rect.bottom)
+                                           for enemy in enemies])
+        for index in damage_taken.nonzero()[0]:
+            enemy = enemies[index]
+            enemy.health -= float(damage_taken[index])
+            if enemy.health <= 0:
+                enemy.kill()
+                game_manager.score += enemy.score_value
+                particles.burst(enemy.rect.centerx, enemy.rect.centery, 48, type(enemy).__name__.lower(), speed=6)
+                telemetry.emit("kill", enemy=type(enemy).__name__.lower(), level=game_manager.current_level)
+
+        particles.update()
 
         # Collision Check (Zombies)
         for zombie in zombies:
+            if game_manager.current_state != GameState.PLAYING:
+                break  # Already dead this frame
             if pygame.sprite.collide_rect(player, zombie):
                 if zombie.can_attack(player):
                     if player.take_damage(zombie.damage):
                         game_manager.current_state = GameState.GAME_OVER
+                        prefetch_level(1, 3)
+                        telemetry.emit("death", cause="zombie", level=game_manager.current_level,
+                                       score=game_manager.score)
 
         # Collision Check (Ghosts)
         for ghost in ghosts:
+            if game_manager.current_state != GameState.PLAYING:
+                break  # Already dead this frame
             if pygame.sprite.collide_rect(player, ghost):
                 if ghost.can_attack(player):
                     if player.take_damage(ghost.damage):
                         game_manager.current_state = GameState.GAME_OVER
+                        prefetch_level(1, 3)
+                        telemetry.emit("death", cause="ghost", level=game_manager.current_level,
+                                       score=game_manager.score)
 
         # Collision Check (Gold)
         collected_gold = pygame.sprite.spritecollide(player, gold_bars, True)
         for gold in collected_gold:
             game_manager.coins_collected += gold.value
             game_manager.score += 10
+            particles.burst(gold.rect.centerx, gold.rect.centery, 16, "gold", speed=3)
+            telemetry.emit("coin", value=gold.value, coins=game_manager.coins_collected,
+                           level=game_manager.current_level)
 
         # Collision Check (Power-ups)
         collected_powerups = pygame.sprite.spritecollide(player, powerups, True)
         for powerup in collected_powerups:
-            if powerup.powerup_type == "health":
-                player.health = min(player.max_health, player.health + powerup.value)
-            elif powerup.powerup_type == "speed":
-                player.speed_boost = powerup.value
-            elif powerup.powerup_type == "damage":
-                player.damage_boost = powerup.value
-            elif powerup.powerup_type == "shield":
-                player.shield_active = True
+            player.apply_powerup(powerup)
             game_manager.score += 50
+            particles.burst(powerup.rect.centerx, powerup.rect.centery, 40, powerup.powerup_type, speed=5, life=45)
+            telemetry.emit("powerup", type=powerup.powerup_type, level=game_manager.current_level)
 
         # Check level completion
         if game_manager.coins_collected >= game_manager.required_coins:
             game_manager.current_state = GameState.LEVEL_COMPLETE
+            prefetch_level(game_manager.current_level + 1, 3 + game_manager.current_level + 1)
+            telemetry.emit("level_complete", level=game_manager.current_level,
+                           score=game_manager.score)
 
     # Draw
     screen.fill((20, 20, 40))
     
     if game_manager.current_state == GameState.PLAYING:
-        all_sprites.draw(screen)
+        renderer.add(current_level.background, (0, 0), BACKGROUND_LAYER)
+        renderer.add_group(all_sprites)
+        renderer.add_many(projectile_img, projectiles.positions(3), PROJECTILE_LAYER)
+        particles.render(renderer, PARTICLE_LAYER)
         
         # Draw UI
-        draw_health_bar(screen, player, 10, 10)
-        draw_coin_counter(screen, game_manager.coins_collected, game_manager.required_coins, 10, 50)
-        draw_powerup_indicators(screen, player, 10, 90)
-        
-        # Score and Level
-        draw_text(f"Score: {game_manager.score}", 30, 10, HEIGHT - 60)
-        draw_text(f"Level: {game_manager.current_level}", 30, 10, HEIGHT - 30)
+        if tier.hud_interval == 1:
+            draw_hud(renderer)
+        else:
+            if governor.frame - hud_drawn_at >= tier.hud_interval:
+                hud_surface.fill((0, 0, 0, 0))
+                draw_hud(hud_renderer)
+                hud_renderer.present()
+                hud_drawn_at = governor.frame
+            renderer.add(hud_surface, (0, 0), HUD_BACK)
         
     elif game_manager.current_state == GameState.PAUSED:
-        all_sprites.draw(screen)
+        renderer.add(current_level.background, (0, 0), BACKGROUND_LAYER)
+        renderer.add_group(all_sprites)
+        renderer.add_many(projectile_img, projectiles.positions(3), PROJECTILE_LAYER)
+        particles.render(renderer, PARTICLE_LAYER)
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        renderer.add(pause_overlay, (0, 0), OVERLAY_LAYER)
         
         # Pause text
         draw_text("PAUSED", 72, WIDTH//2 - 100, HEIGHT//2 - 50)
@@ -888,6 +987,27 @@ while running:
         draw_text(f"Level {game_manager.current_level} Complete!", 36, WIDTH//2 - 120, HEIGHT//2 + 50)
         draw_text("Press ESC to continue to next level", 24, WIDTH//2 - 150, HEIGHT//2 + 90)
     
-    pygame.display.flip()
-
-pygame.quit()
\ No newline at end of file
+    if tier.dirty_rects and game_manager.current_state == GameState.PLAYING:
+        # Push only what changed: last frame's areas and this frame's
+        rects = renderer.present(track=True)
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects + rects)
+        dirty_rects = rects
+    else:
+        renderer.present()
+        pygame.display.flip()
+        dirty_rects = None
+    
+    if recorder is not None:
+        recorder.capture()
+
+if recorder is not None:
+    stop_recording()
+for stopped in stopped_recorders:
+    stopped.close()
+telemetry.emit("session_end", level=game_manager.current_level, score=game_manager.score)
+telemetry.close()
+level_loader.shutdown(wait=False, cancel_futures=True)
+pygame.quit()
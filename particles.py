@@ -0,0 +1,105 @@
+# Particle System
+# Particles are kept in fixed-capacity NumPy buffers like projectiles and
+# integrated as whole arrays each frame. They are drawn from a small set of
+# pre-tinted surfaces, one per color and fade step, so a frame's particles
+# become a few batched blit lists instead of one Sprite each.
+import numpy as np
+import pygame
+
+FADE_STEPS = 4
+PARTICLE_SIZE = 4
+DRAG = 0.92
+
+
+class ParticleSystem:
+    """Fixed-capacity pool of short-lived particles"""
+
+    def __init__(self, capacity, colors):
+        self.capacity = capacity
+        self.limit = capacity  # Live particle cap, lowered by the quality governor
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)  # Frames left to live
+        self.max_life = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.rng = np.random.default_rng()
+
+        # colors maps a name to an RGB tuple, each gets one surface per fade step
+        self.color_index = {}
+        self.surfaces = []
+        for index, (name, rgb) in enumerate(colors.items()):
+            self.color_index[name] = index
+            steps = []
+            for step in range(FADE_STEPS):
+                # Whole-surface alpha blits faster than per-pixel alpha
+                surface = pygame.Surface((PARTICLE_SIZE, PARTICLE_SIZE)).convert()
+                surface.fill(rgb)
+                surface.set_alpha(255 * (step + 1) // FADE_STEPS)
+                steps.append(surface)
+            self.surfaces.append(steps)
+
+    def burst(self, x, y, count, color, speed=4.0, life=30):
+        """Spray count particles of the named color out from (x, y)"""
+        start = self.count
+        end = min(start + count, self.limit)
+        spawned = end - start
+        if spawned <= 0:
+            return 0
+        angles = self.rng.uniform(0, 2 * np.pi, spawned)
+        speeds = self.rng.uniform(0.3, 1.0, spawned) * speed
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angles) * speeds
+        self.vy[start:end] = np.sin(angles) * speeds
+        lifetimes = self.rng.integers(life // 2, life + 1, spawned)
+        self.life[start:end] = lifetimes
+        self.max_life[start:end] = lifetimes
+        self.color[start:end] = self.color_index[color]
+        self.count = end
+        return spawned
+
+    def clear(self):
+        self.count = 0
+
+    def set_limit(self, limit):
+        """Cap live particles, existing ones above the cap fade out normally"""
+        self.limit = min(limit, self.capacity)
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vx[:n] *= DRAG
+        self.vy[:n] *= DRAG
+        self.life[:n] -= 1
+        alive = self.life[:n] > 0
+        keep = int(np.count_nonzero(alive))
+        if keep != n:
+            for array in (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.color):
+                array[:keep] = array[:n][alive]
+            self.count = keep
+
+    def render(self, renderer, layer):
+        """Queue every live particle on the renderer, grouped by surface"""
+        n = self.count
+        if n == 0:
+            return
+        step = (self.life[:n] * FADE_STEPS - 1) // self.max_life[:n]
+        surface_index = self.color[:n] * FADE_STEPS + step
+        order = np.argsort(surface_index, kind="stable")
+        offset = PARTICLE_SIZE // 2
+        xs = (self.x[:n][order] - offset).astype(np.intp)
+        ys = (self.y[:n][order] - offset).astype(np.intp)
+        sorted_index = surface_index[order]
+        bounds = np.flatnonzero(np.diff(sorted_index)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [n]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            index = int(sorted_index[start])
+            surface = self.surfaces[index // FADE_STEPS][index % FADE_STEPS]
+            renderer.add_many(surface, zip(xs[start:end].tolist(), ys[start:end].tolist()), layer)
@@ -0,0 +1,110 @@
+# Projectile System
+# Projectiles live in preallocated struct-of-arrays buffers instead of being
+# Sprites. Live projectiles are packed at the front of the arrays, so movement,
+# wall hits and enemy hits are each a handful of NumPy operations per frame no
+# matter how many projectiles are in flight.
+import numpy as np
+
+
+class ProjectileSystem:
+    """Fixed-capacity pool of projectiles updated as whole arrays"""
+
+    def __init__(self, capacity, tile_size):
+        self.capacity = capacity
+        self.tile_size = tile_size
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)  # Frames left to live
+        self.damage = np.zeros(capacity, dtype=np.float32)
+        self.solid = np.zeros((1, 1), dtype=bool)
+
+    def set_map(self, tile_map):
+        """Use a level's TileMap for wall hits, any non-zero tile blocks"""
+        tiles = np.frombuffer(tile_map.data, dtype=np.uint8)
+        self.solid = tiles.reshape(tile_map.height, tile_map.width) != 0
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+
+    def fire(self, x, y, angles, speed, damage, life):
+        """Spawn one projectile per angle (radians), returns how many fit"""
+        angles = np.asarray(angles, dtype=np.float32)
+        start = self.count
+        end = min(start + len(angles), self.capacity)
+        spawned = end - start
+        if spawned <= 0:
+            return 0
+        angles = angles[:spawned]
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angles) * speed
+        self.vy[start:end] = np.sin(angles) * speed
+        self.life[start:end] = life
+        self.damage[start:end] = damage
+        self.count = end
+        return spawned
+
+    def update(self, enemy_rects):
+        """Move every projectile and resolve hits
+
+        enemy_rects is a sequence of (left, top, right, bottom) rows. Returns
+        the total damage dealt to each enemy as an array of the same length.
+        """
+        n = self.count
+        damage_taken = np.zeros(len(enemy_rects), dtype=np.float32)
+        if n == 0:
+            return damage_taken
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        self.life[:n] -= 1
+        alive = self.life[:n] > 0
+
+        # Wall hits against the tile map, leaving the map counts as a hit
+        rows, cols = self.solid.shape
+        col = np.floor_divide(x, self.tile_size).astype(np.intp)
+        row = np.floor_divide(y, self.tile_size).astype(np.intp)
+        inside = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+        hit_wall = ~inside
+        hit_wall[inside] = self.solid[row[inside], col[inside]]
+        alive &= ~hit_wall
+
+        # Enemy hits, each projectile damages the first enemy it overlaps
+        if len(enemy_rects) and alive.any():
+            rects = np.asarray(enemy_rects, dtype=np.float32)
+            candidates = np.flatnonzero(alive)
+            px = x[candidates, None]
+            py = y[candidates, None]
+            overlap = ((px >= rects[:, 0]) & (px < rects[:, 2]) &
+                       (py >= rects[:, 1]) & (py < rects[:, 3]))
+            hit = overlap.any(axis=1)
+            if hit.any():
+                hitters = candidates[hit]
+                targets = overlap[hit].argmax(axis=1)
+                damage_taken = np.bincount(targets, weights=self.damage[hitters],
+                                           minlength=len(rects)).astype(np.float32)
+                alive[hitters] = False
+
+        self.compact(alive)
+        return damage_taken
+
+    def compact(self, alive):
+        """Pack the surviving projectiles to the front of the buffers"""
+        n = self.count
+        keep = int(np.count_nonzero(alive))
+        if keep == n:
+            return
+        for array in (self.x, self.y, self.vx, self.vy, self.life, self.damage):
+            array[:keep] = array[:n][alive]
+        self.count = keep
+
+    def positions(self, offset=0):
+        """Integer (x, y) of every live projectile, shifted back by offset"""
+        n = self.count
+        xs = (self.x[:n] - offset).astype(np.intp).tolist()
+        ys = (self.y[:n] - offset).astype(np.intp).tolist()
+        return zip(xs, ys)
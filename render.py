@@ -0,0 +1,113 @@
+# Batched Render System
+# Draw calls are collected during the frame and submitted per layer with a
+# single blits() call, sorted by source surface so consecutive blits reuse the
+# same image. Many copies of one surface can be queued as a lazy batch that
+# goes straight into blits() without building a command per copy. Sprite
+# groups are drawn with their own draw(), which is already one blits() call.
+# Static HUD pieces and rendered text are cached as surfaces so they are built
+# once instead of redrawn every frame.
+from itertools import chain, repeat
+
+import pygame
+
+# The baked level background sits below every sprite layer
+BACKGROUND_LAYER = -1
+SPRITE_LAYER = 0
+PROJECTILE_LAYER = 2
+PARTICLE_LAYER = 4
+
+# Layers above every sprite; HUD pieces stack back, fill, frame, then text
+OVERLAY_LAYER = 50
+HUD_BACK = 100
+HUD_FILL = 101
+HUD_FRAME = 102
+HUD_TEXT = 103
+MAX_CACHED_SURFACES = 512
+
+
+def _surface_key(command):
+    return id(command[0])
+
+
+class Renderer:
+    """Collects a frame's draw commands and presents them in batches"""
+
+    def __init__(self, target):
+        self.target = target
+        self.bounds = target.get_rect()
+        self.layers = {}
+        self.batches = {}
+        self.groups = {}
+        self.fonts = {}
+        self.surfaces = {}
+        # pygame-ce provides fblits, a faster blits without per-blit rects
+        self.fblits = getattr(target, "fblits", None)
+
+    def add(self, surface, dest, layer=HUD_TEXT):
+        """Queue a blit of surface at dest on the given layer"""
+        commands = self.layers.get(layer)
+        if commands is None:
+            commands = self.layers[layer] = []
+        commands.append((surface, dest))
+
+    def add_many(self, surface, positions, layer):
+        """Queue the same surface at every position in an iterable"""
+        batches = self.batches.get(layer)
+        if batches is None:
+            batches = self.batches[layer] = []
+        batches.append(zip(repeat(surface), positions))
+
+    def add_group(self, group, layer=SPRITE_LAYER):
+        """Queue a sprite group, drawn below the other commands on its layer"""
+        groups = self.groups.get(layer)
+        if groups is None:
+            groups = self.groups[layer] = []
+        groups.append(group)
+
+    def font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def text(self, text, size, color):
+        """Rendered text surface, reused while the text stays the same"""
+        return self.cached(("text", text, size, color),
+                           lambda: self.font(size).render(text, True, color))
+
+    def cached(self, key, build):
+        """Return the surface stored under key, building it on first use"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if len(self.surfaces) >= MAX_CACHED_SURFACES:
+                self.surfaces.clear()
+            surface = self.surfaces[key] = build()
+        return surface
+
+    def present(self, track=False):
+        """Submit all queued commands, lowest layer first, and reset
+
+        With track set, returns the rects drawn on layers from 0 up, leaving
+        out the background, for updating only the dirty parts of the display.
+        """
+        drawn = []
+        for layer in sorted(self.layers.keys() | self.batches.keys() | self.groups.keys()):
+            for group in self.groups.get(layer, ()):
+                group.draw(self.target)
+                if track and layer >= 0:
+                    drawn.extend(group.spritedict.values())
+            commands = self.layers.get(layer, [])
+            commands.sort(key=_surface_key)
+            batches = self.batches.get(layer)
+            if batches:
+                commands = chain(commands, *batches)
+            if track and layer >= 0:
+                drawn.extend(self.target.blits(commands))
+            elif self.fblits is not None:
+                self.fblits(commands)
+            else:
+                self.target.blits(commands, doreturn=False)
+        self.layers.clear()
+        self.batches.clear()
+        self.groups.clear()
+        return drawn
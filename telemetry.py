@@ -0,0 +1,115 @@
+# Gameplay Telemetry System
+# The game loop pushes events into a fixed-size ring buffer and a background
+# thread drains it into rotating gzip-compressed NDJSON files. The ring has a
+# single producer (the game loop) and a single consumer (the writer), each of
+# which only ever moves its own index, so no lock is needed. When the writer
+# falls behind, new events are dropped and counted instead of blocking.
+import gzip
+import json
+import os
+import threading
+import time
+
+
+class Telemetry:
+    """Non-blocking event recorder for gameplay sessions"""
+
+    def __init__(self, directory="telemetry", capacity=8192, flush_interval=0.5,
+                 max_file_bytes=4 * 1024 * 1024):
+        # Round capacity up to a power of two so indexes wrap with a mask
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.capacity = size
+        self.mask = size - 1
+        self.buffer = [None] * size
+        self.write_index = 0  # Only moved by the game loop
+        self.read_index = 0  # Only moved by the writer thread
+        self.dropped = 0
+
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        now = time.time()
+        millis = int(now * 1000) % 1000
+        self.session = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f".{millis:03d}"
+        self.file_number = 0
+        self.file = None
+        self.file_bytes = 0
+
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="telemetry-writer", daemon=True)
+        self.thread.start()
+
+    def emit(self, kind, **fields):
+        """Record an event, returns False if it was dropped"""
+        write = self.write_index
+        if write - self.read_index >= self.capacity:
+            self.dropped += 1
+            return False
+        self.buffer[write & self.mask] = (time.time(), kind, fields)
+        self.write_index = write + 1
+        return True
+
+    def drain(self):
+        """Take every event currently in the ring, oldest first"""
+        read = self.read_index
+        write = self.write_index
+        batch = []
+        for index in range(read, write):
+            slot = index & self.mask
+            batch.append(self.buffer[slot])
+            self.buffer[slot] = None
+        self.read_index = write
+        return batch
+
+    def run(self):
+        reported_drops = 0
+        while not self.stop_event.wait(self.flush_interval):
+            reported_drops = self.flush(reported_drops)
+        self.flush(reported_drops)
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def flush(self, reported_drops):
+        batch = self.drain()
+        dropped = self.dropped
+        if dropped != reported_drops:
+            batch.append((time.time(), "telemetry_dropped", {"count": dropped - reported_drops}))
+        if batch:
+            lines = []
+            for timestamp, kind, fields in batch:
+                record = {"t": round(timestamp, 4), "event": kind}
+                record.update(fields)
+                lines.append(json.dumps(record, separators=(",", ":")))
+            self.write_batch(("\n".join(lines) + "\n").encode("utf-8"))
+        return dropped
+
+    def write_batch(self, data):
+        if self.file is None or self.file_bytes >= self.max_file_bytes:
+            self.rotate()
+        self.file.write(data)
+        self.file.flush()
+        self.file_bytes += len(data)
+
+    def rotate(self):
+        """Close the current file and start the next one in the session"""
+        if self.file is not None:
+            self.file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        self.file_number += 1
+        while True:
+            name = f"session-{self.session}-{self.file_number:03d}.ndjson.gz"
+            try:
+                self.file = gzip.open(os.path.join(self.directory, name), "xb")
+                break
+            except FileExistsError:
+                # Another session started in the same millisecond
+                self.session += "x"
+        self.file_bytes = 0
+
+    def close(self):
+        """Flush remaining events and stop the writer thread"""
+        self.stop_event.set()
+        self.thread.join()
@@ -0,0 +1,127 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timers import TimerWheel
+
+
+class TimerWheelTest(unittest.TestCase):
+    def test_zero_delay_fires_on_next_slot(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(0, fired.append, "now")
+        wheel.advance(wheel.slot_ms)
+        self.assertEqual(fired, ["now"])
+
+    def test_never_fires_early(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(100, fired.append, "late")
+        wheel.advance(99)
+        self.assertEqual(fired, [])
+        wheel.advance(1 + wheel.slot_ms)
+        self.assertEqual(fired, ["late"])
+
+    def test_long_delay_survives_passes_around_the_wheel(self):
+        wheel = TimerWheel(slot_ms=16, slot_count=8)
+        fired = []
+        wheel.schedule(1000, fired.append, "long")
+        for _ in range(62):
+            wheel.advance(16)
+        self.assertEqual(fired, [])
+        wheel.advance(32)
+        self.assertEqual(fired, ["long"])
+
+    def test_large_dt_fires_everything_due(self):
+        wheel = TimerWheel(slot_ms=16, slot_count=8)
+        fired = []
+        for delay in (0, 5, 50, 127, 128, 400, 10000):
+            wheel.schedule(delay, fired.append, delay)
+        wheel.advance(500)
+        self.assertEqual(sorted(fired), [0, 5, 50, 127, 128, 400])
+        wheel.advance(20000)
+        self.assertEqual(sorted(fired), [0, 5, 50, 127, 128, 400, 10000])
+
+    def test_cancel_from_callback_in_same_tick(self):
+        wheel = TimerWheel()
+        fired = []
+        timers = []
+
+        def cancel_other(name):
+            fired.append(name)
+            for timer in timers:
+                wheel.cancel(timer)
+
+        timers.append(wheel.schedule(10, cancel_other, "a"))
+        timers.append(wheel.schedule(10, cancel_other, "b"))
+        wheel.advance(32)
+        self.assertEqual(len(fired), 1)
+
+    def test_schedule_from_callback(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(10, lambda: wheel.schedule(0, fired.append, "chained"))
+        wheel.advance(16)
+        self.assertEqual(fired, [])
+        wheel.advance(16)
+        self.assertEqual(fired, ["chained"])
+
+    def test_pause_and_clear(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(10, fired.append, "paused")
+        wheel.pause()
+        wheel.advance(1000)
+        self.assertEqual(fired, [])
+        wheel.resume()
+        wheel.clear()
+        wheel.advance(1000)
+        self.assertEqual(fired, [])
+
+    def test_random_schedule_cancel_advance(self):
+        rng = random.Random(1234)
+        for _ in range(500):
+            wheel = TimerWheel(slot_ms=rng.choice([1, 4, 16]), slot_count=rng.choice([4, 16, 256]))
+            fired = {}
+            handles = {}
+            due = {}
+            cancelled = set()
+
+            def fire(key):
+                self.assertNotIn(key, fired)
+                self.assertNotIn(key, cancelled)
+                fired[key] = wheel.now
+                # Callbacks sometimes cancel another pending timer
+                if handles and rng.random() < 0.2:
+                    other = rng.choice(list(handles))
+                    if other not in fired:
+                        wheel.cancel(handles[other])
+                        cancelled.add(other)
+
+            for key in range(rng.randint(1, 40)):
+                action = rng.random()
+                if action < 0.5:
+                    delay = rng.choice([0, rng.randint(1, 50), rng.randint(0, 5000)])
+                    handles[key] = wheel.schedule(delay, fire, key)
+                    due[key] = wheel.now + delay
+                elif action < 0.7 and handles:
+                    other = rng.choice(list(handles))
+                    if other not in fired:
+                        cancelled.add(other)
+                    wheel.cancel(handles[other])
+                else:
+                    wheel.advance(rng.choice([1, wheel.slot_ms, rng.randint(0, 200), rng.randint(0, 20000)]))
+            wheel.advance(20000)
+            wheel.advance(wheel.slot_ms)
+
+            for key, fired_at in fired.items():
+                self.assertGreaterEqual(fired_at, due[key])
+            self.assertEqual(set(fired) | cancelled, set(handles))
+            self.assertFalse(set(fired) & cancelled)
+
+
+if __name__ == "__main__":
+    unittest.main()
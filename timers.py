@@ -0,0 +1,79 @@
+# Timer Wheel System
+# Hashed timer wheel driven by the game clock. Scheduling and cancelling are
+# O(1); advancing only visits the slots that the elapsed time passes over, so
+# entities never have to poll get_ticks() every frame.
+
+class Timer:
+    """Handle returned by TimerWheel.schedule, pass it to cancel()"""
+    __slots__ = ("due", "slot", "callback", "args", "active")
+
+    def __init__(self, due, slot, callback, args):
+        self.due = due
+        self.slot = slot
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+
+class TimerWheel:
+    """Fires callbacks once their delay of game time has elapsed"""
+
+    def __init__(self, slot_ms=16, slot_count=256):
+        self.slot_ms = slot_ms
+        self.slot_count = slot_count
+        self.slots = [dict() for _ in range(slot_count)]
+        self.now = 0  # Game time in ms, frozen while paused
+        self.tick = 0  # Last wheel tick that has been processed
+        self.paused = False
+
+    def schedule(self, delay_ms, callback, *args):
+        """Run callback(*args) after delay_ms of game time"""
+        due = self.now + max(0, delay_ms)
+        # Never land in a slot that has already been processed this tick
+        tick = max(-(-due // self.slot_ms), self.tick + 1)
+        slot = tick % self.slot_count
+        timer = Timer(due, slot, callback, args)
+        self.slots[slot][id(timer)] = timer
+        return timer
+
+    def cancel(self, timer):
+        """Stop a pending timer, safe to call on fired or cancelled timers"""
+        if timer is not None and timer.active:
+            timer.active = False
+            self.slots[timer.slot].pop(id(timer), None)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def clear(self):
+        """Drop every pending timer without firing it"""
+        for slot in self.slots:
+            for timer in slot.values():
+                timer.active = False
+            slot.clear()
+
+    def advance(self, dt_ms):
+        """Move game time forward and fire every timer that came due"""
+        if self.paused:
+            return
+        self.now += dt_ms
+        target = self.now // self.slot_ms
+        # A long frame only needs one sweep around the wheel
+        start = max(self.tick + 1, target - self.slot_count + 1)
+        for tick in range(start, target + 1):
+            self.tick = tick
+            slot = self.slots[tick % self.slot_count]
+            if not slot:
+                continue
+            due = [timer for timer in slot.values() if timer.due <= self.now]
+            for timer in due:
+                # An earlier callback may have cancelled this one
+                if not timer.active:
+                    continue
+                del slot[id(timer)]
+                timer.active = False
+                timer.callback(*timer.args)
+        self.tick = max(self.tick, target)